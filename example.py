@@ -9,25 +9,144 @@ Before running:
 2. Copy config.example.py to config.py and add your private key
 3. This uses MAINNET by default - for testing, set MODE="testnet" in config.py
    and get testnet USDT0 from: https://testnet.nado.xyz/portfolio/faucet
+
+Usage:
+    python example.py            # interactive choice
+    python example.py simple     # or 1 - simple trading example
+    python example.py mm         # or 2 - market making example
+    NADO_EXAMPLE=mm python example.py
 """
 
 import asyncio
+import functools
+import importlib
+import inspect
+import logging
 import os
-from nado_trading_module import NadoTrader
+import sys
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+@functools.lru_cache(maxsize=1)
+def _nado():
+    """
+    Import nado_trading_module on first use.
+
+    The module pulls in the SDK together with web3 and eth_account, so it is
+    only loaded once an example actually runs, not while the menu is shown.
+    """
+    return importlib.import_module("nado_trading_module")
+
+
+@functools.lru_cache(maxsize=1)
+def _account(private_key: str):
+    """
+    Validate the private key and derive its signing account once.
+
+    Raises:
+        ValueError: If the key is not a valid 32-byte hex private key
+    """
+    from eth_account import Account
+    return Account.from_key(private_key)
+
+
+def _load_config() -> Dict[str, Any]:
+    """
+    Snapshot the settings defined in config.py.
+
+    config.py is a plain module, so warm runs already skip re-parsing it:
+    the interpreter reuses the bytecode cached in __pycache__ for as long as
+    the file's mtime is unchanged. Only the uppercase settings are kept.
+    """
+    module = importlib.import_module("config")
+    return {k: getattr(module, k) for k in dir(module) if k.isupper()}
+
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> Tuple[str, str]:
+    """
+    Resolve (PRIVATE_KEY, MODE), preferring environment variables.
+
+    When NADO_PRIVATE_KEY is set, config.py is never opened; otherwise the
+    settings come from config.py.
+    """
+    private_key = os.environ.get('NADO_PRIVATE_KEY')
+    if private_key:
+        return private_key, os.environ.get('NADO_MODE', 'mainnet')
+
+    try:
+        config = _load_config()
+    except ImportError:
+        print("⚠️  config.py not found. Please create it from config.example.py")
+        print("   Or set NADO_PRIVATE_KEY environment variable")
+        return 'your_private_key_here', os.environ.get('NADO_MODE', 'mainnet')
 
-# Try to import from config.py, fallback to environment variable
-try:
-    from config import PRIVATE_KEY, MODE
-except ImportError:
-    print("⚠️  config.py not found. Please create it from config.example.py")
-    print("   Or set NADO_PRIVATE_KEY environment variable")
-    PRIVATE_KEY = os.environ.get('NADO_PRIVATE_KEY', 'your_private_key_here')
-    MODE = os.environ.get('NADO_MODE', 'mainnet')
+    return (
+        config.get('PRIVATE_KEY', 'your_private_key_here'),
+        config.get('MODE', 'mainnet')
+    )
+
+
+# Shared number formatters for the example tables
+_fmt_usd = "{:,.2f}".format
+_fmt_size = "{:.8f}".format
+
+# TTL cache for slowly-changing lookups: {key: (expires_at_monotonic, value)}
+_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _cached(key: str, ttl: float, factory: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for key, refreshing it via factory() after ttl seconds.
+
+    factory may return either a plain value or an awaitable.
+    """
+    now = time.monotonic()
+    hit = _CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+
+    value = factory()
+    if inspect.isawaitable(value):
+        value = await value
+    _CACHE[key] = (now + ttl, value)
+    return value
+
+
+async def _await_order_ack(trader, product_id: int, order_ids, timeout: float = 1.0) -> bool:
+    """
+    Wait until every order in order_ids shows up as an open order.
+
+    Polls the engine with exponential backoff (10ms doubling up to 100ms)
+    instead of sleeping for a fixed worst-case delay.
+
+    Returns:
+        True once all orders are resting, False if timeout elapsed first
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pending = set(order_ids)
+    delay = 0.01
+
+    while True:
+        open_orders = await trader.get_open_orders(product_id=product_id)
+        pending.difference_update(o['digest'] for o in open_orders)
+        if not pending:
+            return True
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.1)
 
 
 async def simple_trading_example():
     """Simple example showing basic trading operations."""
     
+    PRIVATE_KEY, MODE = _settings()
+    
     if PRIVATE_KEY == 'your_private_key_here':
         print("⚠️  Please set your private key!")
         print("   Either:")
@@ -35,25 +154,59 @@ async def simple_trading_example():
         print("   2. Set NADO_PRIVATE_KEY environment variable")
         return
     
+    try:
+        account = _account(PRIVATE_KEY)
+    except ValueError as e:
+        print(f"⚠️  Invalid private key: {e}")
+        return
+    
+    NadoTrader = _nado().NadoTrader
+    
     print("=" * 60)
     print("Nado.xyz Trading Example")
     print("=" * 60)
     
     # Initialize trader with context manager (auto-connects/disconnects)
-    async with NadoTrader(PRIVATE_KEY, mode=MODE) as trader:
+    async with NadoTrader(account, mode=MODE) as trader:
+        
+        # BTC-PERP (usually product_id=1)
+        btc_product_id = 1
+        
+        # Fetch everything the example displays up front, concurrently
+        products, account, orderbook, positions = await asyncio.gather(
+            _cached("products", 60.0, trader.get_perpetual_products),
+            trader.get_account_info(),
+            _cached(
+                f"orderbook:{btc_product_id}:3", 0.25,
+                lambda: trader.get_orderbook(btc_product_id, depth=3)
+            ),
+            trader.get_positions(),
+            return_exceptions=True
+        )
+        
+        # Only the orderbook is allowed to fail (handled in Step 3)
+        for result in (products, account, positions):
+            if isinstance(result, Exception):
+                raise result
+        
+        products_by_id = {p['product_id']: p for p in products}
+        btc_symbol = products_by_id.get(btc_product_id, {}).get('symbol', f"Product {btc_product_id}")
         
         # Step 1: View available products
         print("\n📊 Available Perpetual Products:")
         print("-" * 60)
-        products = trader.get_perpetual_products()
+        lines = []
+        append = lines.append
+        fmt_usd = _fmt_usd
         for p in products[:10]:  # Show first 10
-            price_str = f"${p['price']:,.2f}" if p['price'] else "N/A"
-            print(f"  {p['product_id']:2d}. {p['symbol']:12s} {price_str:>15s}")
+            price = p['price']
+            price_str = "$" + fmt_usd(price) if price else "N/A"
+            append(f"  {p['product_id']:2d}. {p['symbol']:12s} {price_str:>15s}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Step 2: Check account status
         print("\n💰 Account Information:")
         print("-" * 60)
-        account = await trader.get_account_info()
         print(f"  Subaccount: {account['subaccount'][:16]}...")
         print(f"  Health:     {account['health']:.4f}")
         
@@ -62,23 +215,26 @@ async def simple_trading_example():
             if balance['balance'] != 0:
                 print(f"    Product {balance['product_id']}: {balance['balance']:,.8f}")
         
-        # Step 3: Get orderbook for BTC-PERP (usually product_id=1)
-        btc_product_id = 1
-        print(f"\n📖 Orderbook for Product {btc_product_id}:")
+        # Step 3: Show orderbook for BTC-PERP
+        print(f"\n📖 Orderbook for {btc_symbol}:")
         print("-" * 60)
         
         try:
-            orderbook = await trader.get_orderbook(btc_product_id, depth=3)
+            if isinstance(orderbook, Exception):
+                raise orderbook
             
-            print("  Asks (Sell Orders):")
+            lines = ["  Asks (Sell Orders):"]
+            append = lines.append
+            fmt_usd, fmt_size = _fmt_usd, _fmt_size
             for i, ask in enumerate(orderbook['asks'][:3], 1):
-                print(f"    {i}. ${ask['price']:,.2f}  -  {ask['size']:.8f}")
+                append(f"    {i}. ${fmt_usd(ask['price'])}  -  {fmt_size(ask['size'])}")
             
-            print("  ---")
+            append("  ---")
             
-            print("  Bids (Buy Orders):")
+            append("  Bids (Buy Orders):")
             for i, bid in enumerate(orderbook['bids'][:3], 1):
-                print(f"    {i}. ${bid['price']:,.2f}  -  {bid['size']:.8f}")
+                append(f"    {i}. ${fmt_usd(bid['price'])}  -  {fmt_size(bid['size'])}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
             best_bid = orderbook['bids'][0]['price']
             best_ask = orderbook['asks'][0]['price']
@@ -132,7 +288,11 @@ async def simple_trading_example():
         # Step 5: View open orders
         print("\n📋 Open Orders:")
         print("-" * 60)
-        await asyncio.sleep(1)  # Give orders time to register
+        # Wait until the engine reports the orders as resting (at most 1s)
+        await _await_order_ack(
+            trader, btc_product_id,
+            [r['order_id'] for r in (buy_result, sell_result) if r['success']]
+        )
         
         open_orders = await trader.get_open_orders(product_id=btc_product_id)
         
@@ -157,15 +317,22 @@ async def simple_trading_example():
         # Step 7: View positions
         print("\n📈 Current Positions:")
         print("-" * 60)
-        positions = await trader.get_positions()
         
         if positions:
+            lines = []
+            append = lines.append
+            fmt_usd = _fmt_usd
             for pos in positions:
-                side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
-                pnl_emoji = "💚" if pos['unrealized_pnl'] >= 0 else "❤️"
-                print(f"  {side_emoji} Product {pos['product_id']}: "
-                      f"{pos['side'].upper():5s} {abs(pos['size']):,.8f} "
-                      f"{pnl_emoji} PnL: ${pos['unrealized_pnl']:,.2f}")
+                side = pos['side']
+                pnl = pos['unrealized_pnl']
+                side_emoji = "🟢" if side == 'long' else "🔴"
+                pnl_emoji = "💚" if pnl >= 0 else "❤️"
+                pid = pos['product_id']
+                symbol = products_by_id[pid]['symbol'] if pid in products_by_id else f"Product {pid}"
+                append(f"  {side_emoji} {symbol}: "
+                       f"{side.upper():5s} {abs(pos['size']):,.8f} "
+                       f"{pnl_emoji} PnL: ${fmt_usd(pnl)}")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("  No open positions")
     
@@ -177,39 +344,61 @@ async def simple_trading_example():
 async def market_making_example():
     """Example of a simple market-making strategy."""
     
+    PRIVATE_KEY, MODE = _settings()
+    
     if PRIVATE_KEY == 'your_private_key_here':
         print("⚠️  Please set your private key in config.py")
         print("   Or set NADO_PRIVATE_KEY environment variable")
         return
     
+    try:
+        account = _account(PRIVATE_KEY)
+    except ValueError as e:
+        print(f"⚠️  Invalid private key: {e}")
+        return
+    
+    NadoTrader = _nado().NadoTrader
+    
     print("\n🤖 Market Making Strategy Example")
     print("=" * 60)
     print("This example places orders on both sides of the market")
     print("and continuously updates them based on the orderbook.")
     print("=" * 60)
     
-    async with NadoTrader(PRIVATE_KEY, mode=MODE) as trader:
+    async with NadoTrader(account, mode=MODE) as trader:
         
         product_id = 1  # BTC-PERP
         order_size = 0.001
         spread_offset = 20  # $20 from mid-price
         
-        print(f"\nStarting market making on product {product_id}")
+        # Product metadata changes slowly; index it once for the whole run
+        products = await _cached("products", 60.0, trader.get_perpetual_products)
+        products_by_id = {p['product_id']: p for p in products}
+        symbol = products_by_id.get(product_id, {}).get('symbol', f"product {product_id}")
+        fmt_usd = _fmt_usd
+        
+        print(f"\nStarting market making on {symbol}")
         print(f"Order size: {order_size} BTC")
         print(f"Spread offset: ${spread_offset}")
         
         # This is just a demonstration - a real market maker would run in a loop
-        for iteration in range(1):  # Just 1 iteration for demo
+        iterations = 1  # Just 1 iteration for demo
+        
+        for iteration in range(iterations):
             
             # Get current orderbook
-            orderbook = await trader.get_orderbook(product_id, depth=5)
+            orderbook = await _cached(
+                f"orderbook:{product_id}:5", 0.25,
+                lambda: trader.get_orderbook(product_id, depth=5)
+            )
             best_bid = orderbook['bids'][0]['price']
             best_ask = orderbook['asks'][0]['price']
-            mid_price = (best_bid + best_ask) / 2
+            spread = best_ask - best_bid
+            mid_price = best_bid + spread / 2
             
             print(f"\nIteration {iteration + 1}:")
-            print(f"  Mid price: ${mid_price:,.2f}")
-            print(f"  Spread: ${best_ask - best_bid:,.2f}")
+            print(f"  Mid price: ${fmt_usd(mid_price)}")
+            print(f"  Spread: ${fmt_usd(spread)}")
             
             # Cancel existing orders
             await trader.cancel_all_orders(product_id)
@@ -218,23 +407,20 @@ async def market_making_example():
             buy_price = mid_price - spread_offset
             sell_price = mid_price + spread_offset
             
-            # Place buy order
-            await trader.buy_limit(
-                product_id=product_id,
-                price=buy_price,
-                size=order_size,
-                post_only=True
-            )
-            print(f"  📝 Buy order: {order_size} @ ${buy_price:,.2f}")
-            
-            # Place sell order
-            await trader.sell_limit(
-                product_id=product_id,
-                price=sell_price,
+            # Place buy and sell orders concurrently
+            buy_result, sell_result = await trader.quote(
+                product_id,
+                bid_price=buy_price,
+                ask_price=sell_price,
                 size=order_size,
                 post_only=True
             )
-            print(f"  📝 Sell order: {order_size} @ ${sell_price:,.2f}")
+            for label, price, result in (("Buy", buy_price, buy_result), ("Sell", sell_price, sell_result)):
+                if isinstance(result, dict) and result.get('success'):
+                    print(f"  📝 {label} order: {order_size} @ ${fmt_usd(price)}")
+                else:
+                    error = result.get('error', 'Unknown error') if isinstance(result, dict) else result
+                    print(f"  ❌ {label} order failed: {error}")
             
             # In a real implementation, you would:
             # 1. Sleep for some interval
@@ -251,17 +437,39 @@ async def market_making_example():
         print("  - Use more sophisticated pricing")
 
 
+def _run(coro):
+    """Run coro with nado_trading_module.run() (uvloop when installed), imported only now."""
+    return _nado().run(coro)
+
+
+# Accepted values for the example choice (argv[1] or NADO_EXAMPLE)
+_EXAMPLE_CHOICES = {
+    "1": "1", "simple": "1",
+    "2": "2", "mm": "2",
+}
+
+
 if __name__ == "__main__":
-    print("\nChoose an example to run:")
-    print("1. Simple Trading Example (recommended)")
-    print("2. Market Making Example")
+    # Show the trader's status messages as plain lines
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # Scripted runs pass the choice as an argument or via NADO_EXAMPLE,
+    # so the interactive prompt is only shown when neither is given
+    choice = sys.argv[1] if len(sys.argv) > 1 else os.environ.get('NADO_EXAMPLE')
+    
+    if choice is None:
+        print("\nChoose an example to run:")
+        print("1. Simple Trading Example (recommended)")
+        print("2. Market Making Example")
+        
+        choice = input("\nEnter choice (1 or 2): ")
     
-    choice = input("\nEnter choice (1 or 2): ").strip()
+    choice = _EXAMPLE_CHOICES.get(choice.strip().lower())
     
     if choice == "1":
-        asyncio.run(simple_trading_example())
+        _run(simple_trading_example())
     elif choice == "2":
-        asyncio.run(market_making_example())
+        _run(market_making_example())
     else:
         print("Invalid choice. Running simple example...")
-        asyncio.run(simple_trading_example())
+        _run(simple_trading_example())
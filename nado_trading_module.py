@@ -34,29 +34,274 @@ Usage:
 """
 
 import asyncio
+import functools
+import itertools
+import json
+import logging
+import threading
 import time
-from typing import Optional, Dict, Any, List
-from enum import Enum
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
+
+from eth_account.signers.local import LocalAccount
+from eth_utils import keccak
+from requests.adapters import HTTPAdapter
 
 from nado_protocol.client import create_nado_client, NadoClientMode
 from nado_protocol.utils.math import to_x18, from_x18
-from nado_protocol.utils.bytes32 import subaccount_to_hex
+from nado_protocol.utils.bytes32 import subaccount_to_hex, hex_to_bytes32
 from nado_protocol.engine_client.types.execute import (
     PlaceOrderParams,
+    PlaceOrdersParams,
     CancelOrdersParams,
-    CancelProductOrdersParams
+    CancelProductOrdersParams,
+    ExecuteResponse
 )
+from nado_protocol.engine_client.types.stream import StreamAuthenticationParams
+from nado_protocol.contracts.types import NadoExecuteType, NadoTxType
+from nado_protocol.contracts.eip712.domain import get_nado_eip712_domain, get_eip712_domain_type
+from nado_protocol.contracts.eip712.types import get_nado_eip712_type
 from nado_protocol.utils.execute import OrderParams
 
+try:
+    from nado_protocol.ws import (
+        NadoWebSocketClient,
+        NadoSubscriptionClient,
+        BestBidOfferStream,
+        OrderUpdateStream,
+        PositionChangeStream,
+        execute_message
+    )
+except ImportError:  # SDK releases without the gateway WebSocket clients
+    NadoWebSocketClient = None
+    NadoSubscriptionClient = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # Decodes bytes/str frames without an extra copy
+
+    def _json_dumps(obj) -> str:
+        # Sent as a text frame, so decode orjson's bytes
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Library logger; silent unless the application configures logging
+logger = logging.getLogger("nado.trader")
+logger.addHandler(logging.NullHandler())
+
+
+# from_x18 is float(x) / 10**18, recomputing the power on every call; display
+# and PnL conversions divide by this float directly (identical result).
+# Order prices and sizes still go through to_x18 for exact values.
+_X18 = 1e18
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_x18_cached(x: float) -> int:
+    """
+    Memoized to_x18.
+
+    to_x18 goes through Decimal(str(x)), and market makers re-quote the same
+    handful of price and size levels, so repeat conversions become lookups.
+    """
+    return to_x18(x)
+
+
+# Appendix order type bits per time in force; post-only overrides the TIF
+_ORDER_TYPE_BY_TIF = {"GTC": 0, "IOC": 1, "FOK": 2}
+_POST_ONLY_ORDER_TYPE = 3
+
+
+def _round_to_increment(value_x18: int, increment_x18: int) -> int:
+    """
+    Round an x18 value to the nearest multiple of an x18 increment.
+
+    Integer arithmetic, so a price like 0.1 * 3 that picked up float noise
+    on its way to x18 still lands exactly on the tick. Halves round away
+    from zero, symmetrically for negative (sell) amounts.
+    """
+    if increment_x18 <= 1:
+        return value_x18
+    steps, remainder = divmod(abs(value_x18), increment_x18)
+    if 2 * remainder >= increment_x18:
+        steps += 1
+    return steps * increment_x18 if value_x18 >= 0 else -steps * increment_x18
+
+
+def _pack_appendix(order_type: int, reduce_only: bool) -> int:
+    """
+    Pack an order appendix for a cross-margin order with no trigger.
+
+    Appendix structure (128 bits):
+    | value | reserved | trigger | reduce only | order type | isolated | version |
+    | 64    | 50       | 2       | 1           | 2          | 1        | 8       |
+    | 127..64 | 63..14 | 13..12  | 11          | 10..9      | 8        | 7..0    |
+
+    Args:
+        order_type: 0=DEFAULT, 1=IOC, 2=FOK, 3=POST_ONLY
+        reduce_only: Only reduce existing position
+
+    Returns:
+        Appendix as an integer
+    """
+    version = 1  # Version 1
+    isolated = 0  # Cross margin (not isolated)
+    trigger_type = 0  # NONE (0=NONE, 1=PRICE, 2=TWAP, 3=TWAP_CUSTOM)
+
+    return (
+        version |
+        (isolated << 8) |
+        (order_type << 9) |
+        ((1 if reduce_only else 0) << 11) |
+        (trigger_type << 12)
+    )
+
+
+def _rests_on_book(appendix: int) -> bool:
+    """Whether an order with this appendix can rest on the book (IOC/FOK never do)."""
+    return (appendix >> 9) & 0b11 not in (_ORDER_TYPE_BY_TIF["IOC"], _ORDER_TYPE_BY_TIF["FOK"])
+
 
-class OrderSide(Enum):
-    """Order side enum"""
+class _PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout to requests sent without one.
+
+    With orjson installed, responses also decode their JSON body with it:
+    the SDK parses every reply with response.json(), which otherwise goes
+    through the stdlib decoder after first decoding the bytes to text.
+    """
+
+    def __init__(self, timeout: Union[float, Tuple[float, float]], **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        if orjson is not None:
+            default_json = response.json
+
+            def fast_json(**kwargs):
+                # orjson takes no decoder options; keep requests' path for those
+                return default_json(**kwargs) if kwargs else orjson.loads(response.content)
+
+            response.json = fast_json
+        return response
+
+
+class _TokenBucket:
+    """
+    Async token bucket that paces requests to `rate` per second.
+
+    Up to `rate` requests may go out back to back after an idle period;
+    beyond that, acquire() sleeps until its tokens have been refilled.
+    Each caller reserves its tokens up front and sleeps for exactly its own
+    wait, so queued callers go out in arrival order instead of all waking
+    up to compete for each refilled token.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, tokens: int = 1):
+        """Wait until `tokens` are available and take them."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        # Negative balance = tokens promised to callers that are still waiting
+        self._tokens -= tokens
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate)
+            except asyncio.CancelledError:
+                self._tokens += tokens  # Give back what was never used
+                raise
+
+
+class _OrderSigner:
+    """
+    EIP-712 order signer with everything but the order fields hashed once.
+
+    The SDK rebuilds the full typed-data document for every order, then
+    re-derives the type strings and re-hashes the domain while encoding it.
+    Only the struct hash actually changes between orders, so the type
+    hashes and each product's domain separator are computed once here and
+    the order fields are ABI-encoded straight into a single keccak.
+    """
+
+    def __init__(self, account: LocalAccount, chain_id: int, verifying_contract):
+        # eth-account >= 0.13 renamed signHash
+        self._sign_hash = getattr(account, 'unsafe_sign_hash', None) or account.signHash
+        self._chain_id = chain_id
+        self._verifying_contract = verifying_contract  # product_id -> address
+        self._domains: Dict[int, bytes] = {}
+
+        (primary, fields), = get_nado_eip712_type(NadoTxType.PLACE_ORDER).items()
+        self._fields = [(f['name'], f['type']) for f in fields]
+        self._type_hash = keccak(text=self._encode_type(primary, self._fields))
+        self._domain_fields = [(f['name'], f['type']) for f in get_eip712_domain_type()]
+        self._domain_type_hash = keccak(text=self._encode_type("EIP712Domain", self._domain_fields))
+
+    @staticmethod
+    def _encode_type(primary: str, fields: List[Tuple[str, str]]) -> str:
+        return f"{primary}({','.join(f'{t} {n}' for n, t in fields)})"
+
+    @staticmethod
+    def _encode_value(kind: str, value) -> bytes:
+        """ABI-encode one atomic EIP-712 value as a 32-byte word."""
+        if kind == 'string':
+            return keccak(text=value)
+        if kind == 'bytes32':
+            return hex_to_bytes32(value)
+        if kind == 'address':
+            return bytes.fromhex(value[2:]).rjust(32, b'\0')
+        if kind.startswith('int'):
+            return int(value).to_bytes(32, 'big', signed=True)
+        if kind.startswith('uint'):
+            return int(value).to_bytes(32, 'big')
+        raise ValueError(f"Unsupported EIP-712 type: {kind}")
+
+    def _domain_separator(self, product_id: int) -> bytes:
+        domain = self._domains.get(product_id)
+        if domain is None:
+            values = get_nado_eip712_domain(self._verifying_contract(product_id), self._chain_id).dict()
+            domain = keccak(self._domain_type_hash + b"".join(
+                self._encode_value(kind, values[name]) for name, kind in self._domain_fields
+            ))
+            self._domains[product_id] = domain
+        return domain
+
+    def digest(self, product_id: int, order: OrderParams) -> bytes:
+        """EIP-712 digest of an order with sender and nonce already set."""
+        struct_hash = keccak(self._type_hash + b"".join(
+            self._encode_value(kind, getattr(order, name)) for name, kind in self._fields
+        ))
+        return keccak(b"\x19\x01" + self._domain_separator(product_id) + struct_hash)
+
+    def sign(self, product_id: int, order: OrderParams) -> str:
+        """Signature in the same format as the SDK's own order signing."""
+        return self._sign_hash(self.digest(product_id, order)).signature.hex()
+
+
+class OrderSide:
+    """Order side constants (plain strings)"""
     BUY = "buy"
     SELL = "sell"
 
 
-class OrderType(Enum):
-    """Order type enum"""
+class OrderType:
+    """Order type constants (plain strings)"""
     LIMIT = "limit"
     MARKET = "market"
     POST_ONLY = "post_only"
@@ -64,6 +309,25 @@ class OrderType(Enum):
     FOK = "fok"  # Fill or Kill
 
 
+class TimeInForce:
+    """Time in force constants (plain strings, case-insensitive when passed in)"""
+    GTC = "GTC"  # Good Till Cancel
+    IOC = "IOC"  # Immediate or Cancel
+    FOK = "FOK"  # Fill or Kill
+
+
+class PendingOrder(NamedTuple):
+    """Locally tracked order that the indexer may not have picked up yet"""
+    digest: str
+    product_id: int
+    price: float
+    amount: float  # Signed: positive for buys, negative for sells
+    side: str
+    timestamp: float
+    filled: float = 0.0
+    local: bool = True  # Mark as locally tracked
+
+
 class NadoTrader:
     """
     Main trading class for Nado.xyz exchange.
@@ -71,70 +335,687 @@ class NadoTrader:
     Handles connection management, order placement, cancellation,
     and position tracking for futures (perpetuals) trading.
     """
+
+    # Seconds to wait for the gateway's reply to an execute sent over the WebSocket
+    _WS_REPLY_TIMEOUT = 10.0
+
+    # Connections kept per host by each SDK HTTP session. requests' default of 10
+    # is below what quote_many()/bulk fallbacks can have in flight at once.
+    _HTTP_POOL_SIZE = 32
+
+    # (connect, read) seconds before an SDK HTTP request is abandoned; the SDK
+    # sets no timeout, so a stalled connection would otherwise pin a worker
+    # thread forever. A new connection that can't be opened within a few
+    # seconds won't be, so it fails fast instead of waiting out the read timeout.
+    _HTTP_TIMEOUT = (3.05, 10.0)
+
+    # Orders per place_orders request; longer lists are split into several
+    _MAX_BATCH_ORDERS = 50
+
+    # Filled/cancelled digests remembered so a late placement reply can't
+    # put them back into the open-orders mirror
+    _CLOSED_DIGESTS_MAX = 1024
+
+    # Seconds until expiration: GTC orders live 30 days, IOC/FOK 5 minutes
+    _EXPIRATION_BY_TIF = {
+        "GTC": 30 * 24 * 60 * 60,
+        "IOC": 300,
+        "FOK": 300,
+    }
+
+    # Order amounts are signed: positive buys, negative sells
+    _SIGN_BY_SIDE = {OrderSide.BUY: 1, OrderSide.SELL: -1}
+
+    # Every (appendix, seconds until expiration) pair this class can send,
+    # keyed by (post_only, time_in_force, reduce_only)
+    _ORDER_FLAGS = {
+        (post_only, tif, reduce_only): (
+            _pack_appendix(
+                _POST_ONLY_ORDER_TYPE if post_only else _ORDER_TYPE_BY_TIF[tif], reduce_only
+            ),
+            expires_in
+        )
+        # Only the first iterable sees class attributes like _EXPIRATION_BY_TIF
+        for tif, expires_in in _EXPIRATION_BY_TIF.items()
+        for post_only in (False, True)
+        for reduce_only in (False, True)
+    }
     
     def __init__(
         self,
-        private_key: str,
+        private_key: Union[str, LocalAccount],
         mode: str = "mainnet",
-        subaccount_name: str = "default"
+        subaccount_name: str = "default",
+        use_websocket: bool = False,
+        max_order_rate: Optional[float] = 10.0,
+        stream_orders: bool = False
     ):
         """
         Initialize the Nado trader.
         
         Args:
-            private_key: Ethereum private key (with or without 0x prefix)
+            private_key: Ethereum private key (with or without 0x prefix), or an
+                already-derived eth_account LocalAccount to skip re-deriving it
             mode: "mainnet" or "testnet" (default: "mainnet")
             subaccount_name: Subaccount name (max 12 characters)
                 Note: The SDK currently uses "default" as the subaccount.
                 This parameter is stored for future use but may not affect
                 the actual subaccount used by the SDK.
+            use_websocket: Send order placements and cancellations over a
+                persistent gateway WebSocket instead of one HTTPS request each.
+                Falls back to HTTP if the socket can't be opened.
+            max_order_rate: Maximum order placements/cancellations sent per
+                second; bursts above it are queued locally instead of being
+                throttled by the exchange. None disables pacing.
+            stream_orders: Keep local mirrors of open orders and positions
+                updated from the order_update and position_change streams, so
+                get_open_orders() and get_positions() need no request.
         """
         self.private_key = private_key
         self.mode = NadoClientMode.MAINNET if mode.lower() == "mainnet" else NadoClientMode.TESTNET
         self.subaccount_name = subaccount_name
+        self.use_websocket = use_websocket
+        self.stream_orders = stream_orders
+        self._order_bucket = _TokenBucket(max_order_rate) if max_order_rate else None
         self.client = None
+        self._wallet_address = None
+        self._subaccount_hex = None
+        self._order_signer: Optional[_OrderSigner] = None  # Set in connect() once checked against the SDK
+        self._ws = None
+        self._ws_lock = threading.Lock()  # One execute in flight per socket
+        self._nonce_lock = threading.Lock()
+        self._nonce_ms = 0  # recv_time (ms) of the last nonce handed out
+        self._nonce_seq = 0  # Sequence number within that millisecond
+        self._log = logger
+        self._order_stream = None
+        self._open_orders: Dict[str, Dict[str, Any]] = {}  # Mirror of open orders by digest
+        self._open_orders_synced = False  # True once the mirror holds a full engine snapshot
+        self._open_orders_version = 0  # Bumped on every mirror change; snapshots that raced one are dropped
+        self._closed_digests: Dict[str, None] = {}  # Recently filled/cancelled digests, oldest first
+        self._positions: Optional[Dict[int, Tuple[str, str]]] = None  # product_id -> (amount, v_quote) x18
+        self._positions_version = 0  # Bumped per position_change; snapshots that raced one are dropped
+        self._stream_lock = threading.Lock()  # Mirrors are updated from the stream thread
+        self._bbo_stream = None
+        # product_id -> (bid, ask, monotonic time received)
+        self._best_bid_offers: Dict[int, Tuple[Optional[float], Optional[float], float]] = {}
         self._products_cache = None
+        self._perp_products_view = []  # get_perpetual_products() result, built in _load_products
+        self._perp_by_id: Dict[int, Any] = {}  # product_id -> perp product, built in _load_products
+        self._perp_mark_prices: Dict[int, float] = {}  # product_id -> risk/oracle price, built with _perp_by_id
+        self._perp_increments: Dict[int, Tuple[int, int]] = {}  # product_id -> (price tick, size lot) x18
+        self._perp_min_sizes: Dict[int, int] = {}  # product_id -> minimum order value x18
+        self._perp_by_symbol: Dict[str, Dict[str, Any]] = {}  # symbol -> get_perpetual_products() entry
         self._ticker_map = {}
-        self._pending_orders = {}  # Track orders not yet indexed: {digest: order_info}
+        self._last_account_info = None  # (monotonic time, SubaccountInfoData)
+        self._account_info_request = None  # In-flight subaccount query, shared by callers
+        self._orderbook_cache: Dict[Tuple[int, int], Tuple[float, asyncio.Future]] = {}
+        self._pending_orders: Dict[str, PendingOrder] = {}  # Track orders not yet indexed
         
     async def connect(self):
         """Initialize connection to Nado exchange."""
         if not self.client:
-            self.client = create_nado_client(
+            # Client setup fetches contract addresses over the network
+            self.client = await asyncio.to_thread(
+                create_nado_client,
                 self.mode,
                 self.private_key
             )
-            print(f"✓ Connected to Nado ({self.mode.value}, subaccount: {self.subaccount_name})")
+
+            # Wallet and subaccount are fixed for the client's lifetime
+            self._wallet_address = self.client.context.signer.address
+            self._subaccount_hex = subaccount_to_hex(self._wallet_address, self.subaccount_name)
+
+            self._configure_http_sessions()
+
+            self._log.info("✓ Connected to Nado (%s, subaccount: %s)", self.mode.value, self.subaccount_name)
             
+            if self.use_websocket:
+                await asyncio.to_thread(self._connect_websocket)
+
             # Cache products
             await self._load_products()
+
+            # Pay the signing stack's one-time setup now, not on the first order
+            await asyncio.to_thread(self._warm_up_order_signing)
+
+            if self.stream_orders:
+                await asyncio.to_thread(self._connect_order_stream)
             
     async def disconnect(self):
         """Close connection to Nado exchange."""
+        if self._ws:
+            self._ws.close()
+            self._ws = None
+        if self._order_stream:
+            stream, self._order_stream = self._order_stream, None
+            stream.close()
+            with self._stream_lock:
+                self._open_orders_synced = False
+                self._positions = None
+        if self._bbo_stream:
+            stream, self._bbo_stream = self._bbo_stream, None
+            stream.close()
+            self._best_bid_offers = {}
         if self.client:
-            # The SDK doesn't require explicit disconnection
+            # Release the pooled keep-alive connections
+            for session in self._http_sessions():
+                session.close()
             self.client = None
-            print("✓ Disconnected from Nado")
+            self._wallet_address = None
+            self._subaccount_hex = None
+            self._order_signer = None
+            self._last_account_info = None
+            self._account_info_request = None
+            self._log.info("✓ Disconnected from Nado")
     
+    def _warm_up_order_signing(self):
+        """
+        Set up the cached order signer and sign one throwaway order.
+
+        The first EIP-712 signature builds the typed-data encoders, keccak
+        and the signing key's curve state, which costs far more than any
+        later signature. Doing it at connect() keeps that off the first order.
+
+        The cached signer is only enabled if its digest for the throwaway
+        order matches the SDK's; otherwise orders keep the SDK's signing.
+        """
+        product_id = next(iter(self._perp_by_id), None)
+        if product_id is None:
+            return
+
+        try:
+            engine = self.client.context.engine_client
+            # Built directly: it is never sent, so it needn't pass the
+            # product's lot/tick/minimum-value checks in _build_order_params
+            appendix, expires_in = self._ORDER_FLAGS[(True, "GTC", False)]
+            order = engine.prepare_execute_params(OrderParams(
+                sender=self._subaccount_hex,
+                priceX18=10**18,
+                amount=10**18,
+                expiration=time.time_ns() // 1_000_000_000 + expires_in,
+                nonce=None,
+                appendix=appendix
+            ), True)
+            engine.sign(
+                NadoExecuteType.PLACE_ORDER,
+                order.dict(),
+                engine.order_verifying_contract(product_id),
+                engine.chain_id,
+                engine.linked_signer
+            )
+        except Exception as e:
+            # Only a warm-up: the first real order will simply be slower
+            self._log.debug("🔍 Order signing warm-up failed: %s", e)
+            return
+
+        try:
+            signer = _OrderSigner(engine.linked_signer, engine.chain_id, engine.order_verifying_contract)
+            expected = engine.get_order_digest(order, product_id)
+            if "0x" + signer.digest(product_id, order).hex() != expected:
+                self._log.warning("⚠️  Cached order signer disagrees with the SDK, using SDK signing")
+                return
+            signer.sign(product_id, order)
+            self._order_signer = signer
+        except Exception as e:
+            self._log.debug("🔍 Cached order signer unavailable, using SDK signing: %s", e)
+
+    def _presign_order(self, params: PlaceOrderParams) -> PlaceOrderParams:
+        """
+        Sign an order with the cached signer, if enabled.
+
+        The SDK keeps a signature that is already set, so orders signed
+        here skip its typed-data signing; without the cached signer the
+        params are returned unsigned and the SDK signs them as before.
+        """
+        if self._order_signer is not None and params.signature is None:
+            params.signature = self._order_signer.sign(params.product_id, params.order)
+        return params
+
+    def _place_order_http(self, params: PlaceOrderParams):
+        """Sign (off the event loop) and place one order over HTTP."""
+        return self.client.market.place_order(params=self._presign_order(params))
+
+    def _place_orders_http(self, orders: List[PlaceOrderParams], stop_on_failure: bool):
+        """Sign (off the event loop) and place a batch of orders over HTTP."""
+        return self.client.context.engine_client.place_orders(
+            PlaceOrdersParams(
+                orders=[self._presign_order(o) for o in orders],
+                stop_on_failure=stop_on_failure
+            )
+        )
+
+    def _http_sessions(self) -> List[Any]:
+        """Return the requests.Session objects used by the SDK clients."""
+        context = self.client.context
+        clients = (context.engine_client, context.indexer_client, context.trigger_client)
+        return [c.session for c in clients if c is not None and hasattr(c, 'session')]
+
+    def _configure_http_sessions(self):
+        """
+        Widen the connection pools of the SDK's HTTP sessions.
+
+        Each SDK client already keeps one requests.Session for its lifetime,
+        so TCP/TLS connections are reused between calls. Requests issued from
+        worker threads at the same time each need their own connection,
+        though, and anything beyond the pool size is opened and then thrown
+        away after the call. Mounting a larger adapter keeps those warm too.
+        """
+        for session in self._http_sessions():
+            adapter = _PooledHTTPAdapter(
+                timeout=self._HTTP_TIMEOUT,
+                pool_connections=4,
+                pool_maxsize=self._HTTP_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+    def _connect_websocket(self):
+        """Open the persistent gateway WebSocket used for order execution."""
+        if NadoWebSocketClient is None:
+            self._log.warning("⚠️  Installed nado-protocol has no WebSocket client, using HTTP for orders")
+            return
+
+        try:
+            # The client keeps the connection alive with protocol-level pings
+            self._ws = NadoWebSocketClient(self.client.context.engine_client.url).connect()
+            self._log.info("✓ Order WebSocket connected")
+        except Exception as e:
+            self._log.warning("⚠️  Could not open order WebSocket (%s), using HTTP for orders", e)
+            self._ws = None
+
+    def _execute_over_websocket(self, execute_type: NadoExecuteType, params):
+        """
+        Sign an execute locally and send it over the order WebSocket.
+
+        Nonce injection and EIP-712 signing (or the cached order signer) are
+        the same as on the HTTP path; only the transport differs.
+
+        Args:
+            execute_type: NadoExecuteType.PLACE_ORDER, CANCEL_ORDERS or
+                CANCEL_PRODUCT_ORDERS
+            params: PlaceOrderParams, CancelOrdersParams or
+                CancelProductOrdersParams (unsigned)
+
+        Returns:
+            ExecuteResponse from the gateway
+        """
+        engine = self.client.context.engine_client
+
+        if execute_type == NadoExecuteType.PLACE_ORDER:
+            params = self._presign_order(PlaceOrderParams.model_validate(params))
+            params.order = engine.prepare_execute_params(params.order, True)
+            message = params.order.dict()
+            verifying_contract = engine.order_verifying_contract(params.product_id)
+        else:
+            params = engine.prepare_execute_params(params, True)
+            message = params.dict()
+            verifying_contract = engine.endpoint_addr
+
+        if params.signature is None:
+            params.signature = engine.sign(
+                execute_type, message, verifying_contract, engine.chain_id, engine.linked_signer
+            )
+
+        # Responses are matched to requests by order of arrival
+        with self._ws_lock:
+            # Another thread may have dropped the socket while this one waited
+            ws = self._ws
+            if ws is not None:
+                try:
+                    ws.ws.send(_json_dumps(execute_message(params)))
+                    response = _json_loads(ws.ws.recv(timeout=self._WS_REPLY_TIMEOUT))
+                except Exception:
+                    # Never re-send on another transport: the order may already be live.
+                    # Later executes go over HTTP.
+                    self._log.warning("⚠️  Order WebSocket failed, using HTTP from now on")
+                    ws.close()
+                    if self._ws is ws:
+                        self._ws = None
+                    raise
+
+        if ws is None:
+            # Nothing was sent yet, so the signed execute can go over HTTP
+            return engine.execute(params)
+
+        result = ExecuteResponse(**response)
+        if result.status != "success":
+            raise RuntimeError(result.error or f"{execute_type.value} failed: {response}")
+        return result
+
+    def _connect_order_stream(self):
+        """Subscribe to this subaccount's order and position updates and start the reader thread."""
+        if NadoSubscriptionClient is None:
+            self._log.warning("⚠️  Installed nado-protocol has no subscription client, open orders are queried")
+            return
+
+        try:
+            stream = NadoSubscriptionClient(self.client.context.engine_client.url).connect()
+            self._check_stream_ack(stream.authenticate(self._sign_stream_authentication()))
+            self._subscribe_all(stream, [
+                OrderUpdateStream(subaccount=self._subaccount_hex),
+                PositionChangeStream(subaccount=self._subaccount_hex)
+            ])
+        except Exception as e:
+            self._log.warning("⚠️  Could not subscribe to order updates (%s), open orders are queried", e)
+            return
+
+        self._order_stream = stream
+        threading.Thread(
+            target=self._run_order_stream,
+            args=(stream,),
+            name="nado-order-updates",
+            daemon=True
+        ).start()
+        self._log.info("✓ Order update stream connected")
+
+    @staticmethod
+    def _check_stream_ack(ack: Dict[str, Any]):
+        """Raise if a subscription-endpoint control message was rejected."""
+        if ack.get('error'):
+            raise RuntimeError(ack['error'])
+
+    @classmethod
+    def _subscribe_all(cls, stream, subscriptions: List[Any]):
+        """
+        Subscribe to several streams with a single request.
+
+        subscribe() blocks on recv() for each ack, so an event arriving
+        between two acks would be read (and dropped) as an ack. One
+        subscribe_multi has one ack, sent before any of its events.
+        """
+        cls._check_stream_ack(stream.subscribe_multi(subscriptions))
+
+    def _sign_stream_authentication(self) -> StreamAuthenticationParams:
+        """Sign a short-lived stream authentication for this subaccount."""
+        engine = self.client.context.engine_client
+        expiration = time.time_ns() // 1_000_000 + 60_000  # Milliseconds; only needs to outlive the handshake
+
+        signature = engine.sign(
+            NadoTxType.AUTHENTICATE_STREAM,
+            {'sender': hex_to_bytes32(self._subaccount_hex), 'expiration': expiration},
+            engine.endpoint_addr,
+            engine.chain_id,
+            engine.linked_signer
+        )
+        return StreamAuthenticationParams(
+            sender=self._subaccount_hex,
+            expiration=expiration,
+            signature=signature
+        )
+
+    def _run_order_stream(self, stream):
+        """Apply stream events to the local mirrors until the stream closes."""
+        try:
+            for event in stream.listen():
+                event_type = event.get('type')
+                if event_type == 'order_update':
+                    self._apply_order_update(event)
+                elif event_type == 'position_change':
+                    self._apply_position_change(event)
+        except Exception as e:
+            if self._order_stream is stream:
+                self._log.warning("⚠️  Order update stream closed (%s), open orders are queried", e)
+        finally:
+            with self._stream_lock:
+                if self._order_stream is stream:
+                    self._order_stream = None
+                self._open_orders_synced = False
+                self._positions = None
+
+    async def stream_best_bid_offers(self, product_ids: Optional[List[int]] = None) -> bool:
+        """
+        Keep the best bid and ask of some products updated from the
+        best_bid_offer stream, so get_best_bid_offer() needs no request.
+
+        Args:
+            product_ids: Products to follow (None = every perpetual product)
+
+        Returns:
+            True if the stream is running, False if it couldn't be opened
+            (get_best_bid_offer() then queries the orderbook)
+        """
+        self._ensure_connected()
+
+        if self._bbo_stream is None:
+            if product_ids is None:
+                product_ids = list(self._perp_by_id)
+            await asyncio.to_thread(self._connect_bbo_stream, product_ids)
+        return self._bbo_stream is not None
+
+    def _connect_bbo_stream(self, product_ids: List[int]):
+        """Subscribe to best bid/offer updates for the products and start the reader thread."""
+        if NadoSubscriptionClient is None:
+            self._log.warning("⚠️  Installed nado-protocol has no subscription client, orderbooks are queried")
+            return
+
+        try:
+            # Market data streams are public, so no authentication is needed
+            stream = NadoSubscriptionClient(self.client.context.engine_client.url).connect()
+            self._subscribe_all(stream, [BestBidOfferStream(product_id=pid) for pid in product_ids])
+        except Exception as e:
+            self._log.warning("⚠️  Could not subscribe to best bid/offer updates (%s), orderbooks are queried", e)
+            return
+
+        self._bbo_stream = stream
+        threading.Thread(
+            target=self._run_bbo_stream,
+            args=(stream,),
+            name="nado-best-bid-offer",
+            daemon=True
+        ).start()
+        self._log.info("✓ Best bid/offer stream connected (%s products)", len(product_ids))
+
+    def _run_bbo_stream(self, stream):
+        """Record the latest best bid and ask per product until the stream closes."""
+        try:
+            for event in stream.listen():
+                if event.get('type') != 'best_bid_offer':
+                    continue
+                # A zero price means that side of the book is empty
+                bid_x18 = int(event.get('bid_price', 0))
+                ask_x18 = int(event.get('ask_price', 0))
+                # One assignment, so readers never see a half-updated quote
+                self._best_bid_offers[int(event['product_id'])] = (
+                    bid_x18 / _X18 if bid_x18 else None,
+                    ask_x18 / _X18 if ask_x18 else None,
+                    time.monotonic()
+                )
+        except Exception as e:
+            if self._bbo_stream is stream:
+                self._log.warning("⚠️  Best bid/offer stream closed (%s), orderbooks are queried", e)
+        finally:
+            if self._bbo_stream is stream:
+                self._bbo_stream = None
+                self._best_bid_offers = {}
+
+    def _apply_order_update(self, event: Dict[str, Any]):
+        """
+        Update the open-orders mirror from one order_update event.
+
+        Args:
+            event: Event with digest, product_id, amount (remaining, x18) and
+                reason ("placed", "filled" or "cancelled")
+        """
+        digest = event.get('digest')
+
+        with self._stream_lock:
+            self._open_orders_version += 1
+            if event.get('reason') == 'cancelled':
+                self._close_open_order(digest)
+                return
+            if 'amount' not in event:
+                # Unexpected payload: stop trusting the mirror until the next query
+                self._open_orders_synced = False
+                return
+
+            remaining = int(event['amount']) / _X18
+            order = self._open_orders.get(digest)
+            if remaining == 0:
+                self._close_open_order(digest)
+            elif order is not None:
+                order['unfilled_amount'] = abs(remaining)
+            else:
+                # Placed by another client; its price is only known to the
+                # engine, so take a fresh snapshot on the next read
+                self._open_orders_synced = False
+
+    def _close_open_order(self, digest: str):
+        """Drop a filled/cancelled order from the mirror and remember it (caller holds _stream_lock)."""
+        self._open_orders.pop(digest, None)
+        self._closed_digests[digest] = None
+        if len(self._closed_digests) > self._CLOSED_DIGESTS_MAX:
+            del self._closed_digests[next(iter(self._closed_digests))]
+
+    def _apply_position_change(self, event: Dict[str, Any]):
+        """
+        Update the positions mirror from one position_change event.
+
+        Args:
+            event: Event with product_id, amount and v_quote_amount (x18)
+        """
+        with self._stream_lock:
+            # Balances moved, so a cached subaccount snapshot is stale either
+            # way, and so is any query already in flight
+            self._positions_version += 1
+            self._last_account_info = None
+            if self._positions is None:
+                return
+            if 'amount' not in event or 'v_quote_amount' not in event:
+                # Unexpected payload: stop trusting the mirror until the next query
+                self._positions = None
+                return
+            self._positions[int(event['product_id'])] = (event['amount'], event['v_quote_amount'])
+
+    def _sync_open_orders(self, open_orders: List[Dict[str, Any]], product_id: Optional[int], version: int):
+        """
+        Replace the mirror (or one product's part of it) with an engine snapshot.
+
+        Args:
+            open_orders: Orders from the engine
+            product_id: Product the snapshot covers (None = all products)
+            version: _open_orders_version when the query was sent; if the
+                mirror changed since, the snapshot may predate a fill or
+                cancel and is not applied (the next read queries again)
+        """
+        with self._stream_lock:
+            if self._open_orders_version != version:
+                return
+            if product_id is None:
+                self._open_orders = {o['digest']: o for o in open_orders}
+                self._open_orders_synced = True
+            else:
+                for digest in [d for d, o in self._open_orders.items() if o['product_id'] == product_id]:
+                    del self._open_orders[digest]
+                self._open_orders.update((o['digest'], o) for o in open_orders)
+
+    def _forget_open_orders(self, product_ids: Optional[set] = None, digest: Optional[str] = None):
+        """Drop cancelled orders from the mirror, by digest or by product."""
+        with self._stream_lock:
+            self._open_orders_version += 1
+            if digest is not None:
+                self._open_orders.pop(digest, None)
+            else:
+                for d in [d for d, o in self._open_orders.items() if o['product_id'] in product_ids]:
+                    del self._open_orders[d]
+
     async def _load_products(self):
         """Load and cache available products."""
-        products = self.client.context.engine_client.get_all_products()
+        # Products and ticker symbols come from different services, so fetch
+        # them concurrently rather than paying the two round-trips in series
+        products, self._ticker_map = await asyncio.gather(
+            asyncio.to_thread(self.client.context.engine_client.get_all_products),
+            self._load_ticker_map()
+        )
         self._products_cache = {
             'spot': products.spot_products,
             'perp': products.perp_products
         }
 
-        # Load ticker information from indexer
+        self._index_perp_products()
+        self._perp_products_view = self._build_perp_products_view()
+        self._perp_by_symbol = {p['symbol']: p for p in self._perp_products_view}
+
+    async def _load_ticker_map(self) -> Dict[int, str]:
+        """Load the product_id -> base currency symbol map from the indexer."""
         try:
-            tickers = self.client.context.indexer_client.get_tickers()
-            self._ticker_map = {
+            tickers = await asyncio.to_thread(self.client.context.indexer_client.get_tickers)
+            return {
                 v['product_id']: v['base_currency']
                 for v in tickers.values()
                 if isinstance(v, dict) and 'product_id' in v and 'base_currency' in v
             }
         except Exception as e:
-            print(f"⚠️  Could not load tickers: {e}")
-            self._ticker_map = {}
+            self._log.warning("⚠️  Could not load tickers: %s", e)
+            return {}
+
+    def _index_perp_products(self):
+        """Build the product_id -> perp product lookup from the products cache."""
+        self._perp_by_id = {}
+        for p in self._products_cache['perp']:
+            # Keep the first occurrence, like get_perpetual_products()
+            self._perp_by_id.setdefault(p.product_id, p)
+
+        # Derive per-product values once per product refresh: mark prices for
+        # the PnL in every get_account_info() call, and tick/lot increments
+        # for every order
+        self._perp_mark_prices = {}
+        self._perp_increments = {}
+        self._perp_min_sizes = {}
+        for product_id, p in self._perp_by_id.items():
+            book_info = getattr(p, 'book_info', None)
+            if book_info is not None:
+                self._perp_increments[product_id] = (
+                    int(book_info.price_increment_x18),
+                    int(book_info.size_increment)
+                )
+                if getattr(book_info, 'min_size', None):
+                    self._perp_min_sizes[product_id] = int(book_info.min_size)
+
+            price_x18 = getattr(getattr(p, 'risk', None), 'price_x18', None)
+            if price_x18 is None:
+                price_x18 = getattr(p, 'oracle_price_x18', None)
+            if price_x18 is not None:
+                self._perp_mark_prices[product_id] = int(price_x18) / _X18
+
+    def get_product_by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a perpetual product by its ticker symbol.
+
+        Args:
+            symbol: Symbol as shown by get_perpetual_products() (e.g. "BTC")
+
+        Returns:
+            The product dict from get_perpetual_products(), or None if unknown
+        """
+        return self._perp_by_symbol.get(symbol)
+
+    async def refresh_prices(self) -> List[Dict[str, Any]]:
+        """
+        Re-fetch oracle prices and update the cached perpetual products in place.
+
+        Returns:
+            The refreshed list from get_perpetual_products()
+        """
+        self._ensure_connected()
+
+        products = await asyncio.to_thread(self.client.context.engine_client.get_all_products)
+        self._products_cache = {
+            'spot': products.spot_products,
+            'perp': products.perp_products
+        }
+        self._index_perp_products()
+
+        oracle_prices = {
+            p.product_id: getattr(p, 'oracle_price_x18', None)
+            for p in products.perp_products
+        }
+        for product in self._perp_products_view:
+            oracle_price_x18 = oracle_prices.get(product['product_id'])
+            if oracle_price_x18:
+                product['oracle_price_x18'] = oracle_price_x18
+                product['price'] = int(oracle_price_x18) / _X18
+
+        return self._perp_products_view
     
     def get_perpetual_products(self) -> List[Dict[str, Any]]:
         """
@@ -143,123 +1024,167 @@ class NadoTrader:
         Note: Product IDs are not sequential. Nado uses sparse numbering
         (typically even numbers: 2, 4, 6, 8, etc.) and not all IDs are active.
 
+        The list is built once when products are loaded, so prices are the
+        oracle prices at connect() time. Call refresh_prices() to update them.
+
         Returns:
             List of perpetual products with their details including actual ticker symbols
         """
         if not self._products_cache:
             raise RuntimeError("Not connected. Call connect() first.")
 
-        # Use dictionary to ensure uniqueness by product_id
-        products_dict = {}
+        return self._perp_products_view
 
-        for p in self._products_cache['perp']:
-            product_id = p.product_id
-
-            # Skip if already processed (only keep first occurrence)
-            if product_id in products_dict:
-                continue
+    def _build_perp_products_view(self) -> List[Dict[str, Any]]:
+        """Build the sorted list of perpetual product dicts from _perp_by_id."""
+        products = []
 
+        # _perp_by_id already keeps one product per id (the first occurrence).
+        # The SDK doesn't promise product_id order, so the sort stays; keying
+        # on the id alone skips comparing whole (id, product) tuples.
+        for product_id, p in sorted(self._perp_by_id.items(), key=itemgetter(0)):
             # Get ticker symbol from the ticker map loaded from indexer API
             symbol = self._ticker_map.get(product_id, f'PERP-{product_id}')
 
             # Calculate max leverage from risk weights
             # The initial margin weights determine the max leverage:
             # max_leverage = 1 / |1 - initial_weight|
+            # Long weight initial is used by most products; short weight
+            # initial is the fallback. Both give the same margin fraction.
+            risk = getattr(p, 'risk', None)
+            weight_x18 = getattr(risk, 'long_weight_initial_x18', None)
+            if weight_x18 is None:
+                weight_x18 = getattr(risk, 'short_weight_initial_x18', None)
+
             max_leverage = None
-            if hasattr(p, 'risk'):
-                risk = p.risk
-
-                # Try to get long weight initial (most products use this)
-                if hasattr(risk, 'long_weight_initial_x18'):
-                    long_weight_initial = from_x18(int(risk.long_weight_initial_x18))
-                    # Calculate max leverage: 1 / |1 - weight|
-                    margin_fraction = abs(1.0 - long_weight_initial)
-                    if margin_fraction > 0:
-                        max_leverage = 1.0 / margin_fraction
-
-                # Alternatively, could use short weight initial
-                elif hasattr(risk, 'short_weight_initial_x18'):
-                    short_weight_initial = from_x18(int(risk.short_weight_initial_x18))
-                    margin_fraction = abs(short_weight_initial - 1.0)
-                    if margin_fraction > 0:
-                        max_leverage = 1.0 / margin_fraction
-
-            products_dict[product_id] = {
+            if weight_x18 is not None:
+                margin_fraction = abs(1.0 - from_x18(int(weight_x18)))
+                if margin_fraction > 0:
+                    max_leverage = 1.0 / margin_fraction
+
+            oracle_price_x18 = getattr(p, 'oracle_price_x18', None)
+            tick_x18, lot_x18 = self._perp_increments.get(product_id, (None, None))
+            min_size_x18 = self._perp_min_sizes.get(product_id)
+
+            products.append({
                 'product_id': product_id,
                 'symbol': symbol,
-                'oracle_price_x18': getattr(p, 'oracle_price_x18', None),
-                'price': from_x18(p.oracle_price_x18) if hasattr(p, 'oracle_price_x18') and p.oracle_price_x18 else None,
-                'max_leverage': max_leverage
-            }
-
-        # Convert to sorted list by product_id
-        products = sorted(products_dict.values(), key=lambda x: x['product_id'])
+                'oracle_price_x18': oracle_price_x18,
+                'price': int(oracle_price_x18) / _X18 if oracle_price_x18 else None,
+                'max_leverage': max_leverage,
+                'tick_size': tick_x18 / _X18 if tick_x18 else None,  # Price increment
+                'lot_size': lot_x18 / _X18 if lot_x18 else None,  # Size increment
+                'min_size': min_size_x18 / _X18 if min_size_x18 else None  # Minimum order value (USD)
+            })
 
         return products
     
-    async def get_account_info(self) -> Dict[str, Any]:
+    async def get_account_info(self, max_age: float = 0.2) -> Dict[str, Any]:
         """
         Get account information including balances and positions.
+
+        Args:
+            max_age: Reuse a subaccount snapshot up to this many seconds old
+                (0 = always query the engine)
         
         Returns:
             Dictionary with account details
         """
         self._ensure_connected()
         
-        # Get wallet address and derive subaccount using the SDK utility
-        wallet_address = self.client.context.signer.address
-        subaccount_hex = subaccount_to_hex(wallet_address, self.subaccount_name)
-        
-        info = self.client.context.engine_client.get_subaccount_info(subaccount_hex)
-
-        # Calculate unrealized PnL for each balance
-        balances = []
-        for b in info.spot_balances + info.perp_balances:
-            amount = from_x18(int(b.balance.amount)) if b.balance.amount != '0' else 0
-
-            # Calculate PnL for perp positions
-            unrealized_pnl = 0
-            if amount != 0 and b.product_id in {p.product_id for p in self._products_cache['perp']}:
-                # Get current price from the fresh info object (more accurate)
-                # The info object contains the actual risk prices used for calculations
-                product_risk = next((p for p in self._products_cache['perp'] if p.product_id == b.product_id), None)
-
-                # Try to get price from the risk object in the fresh info
-                current_price = None
-                if hasattr(product_risk, 'risk') and hasattr(product_risk.risk, 'price_x18'):
-                    current_price = from_x18(int(product_risk.risk.price_x18))
-                elif hasattr(product_risk, 'oracle_price_x18'):
-                    current_price = from_x18(int(product_risk.oracle_price_x18))
-
-                if current_price:
-                    v_quote = from_x18(int(b.balance.v_quote_balance))
-
-                    # Debug for first position
-                    if amount != 0:
-                        print(f"\n🔍 PnL Calculation for Product {b.product_id}:")
-                        print(f"  Amount: {amount}")
-                        print(f"  Current Price: ${current_price:,.2f}")
-                        print(f"  v_quote_balance: ${v_quote:,.2f}")
-                        position_value = amount * current_price
-                        print(f"  Position Value: ${position_value:,.2f}")
-                        unrealized_pnl = position_value + v_quote
-                        print(f"  Calculated PnL: ${unrealized_pnl:,.2f}\n")
-                    else:
-                        # PnL = position_value + v_quote_balance
-                        position_value = amount * current_price
-                        unrealized_pnl = position_value + v_quote
-
-            balances.append({
-                'product_id': b.product_id,
-                'balance': amount,
-                'unrealized_pnl': unrealized_pnl
-            })
+        info = await self._fetch_subaccount_info(max_age)
+        balances = [
+            self._balance_entry(b.product_id, b.balance.amount, getattr(b.balance, 'v_quote_balance', '0'))
+            for b in itertools.chain(info.spot_balances, info.perp_balances)
+        ]
 
         return {
-            'subaccount': subaccount_hex,
+            'subaccount': self._subaccount_hex,
             'health': info.healths if hasattr(info, 'healths') else None,
             'balances': balances
         }
+
+    async def _fetch_subaccount_info(self, max_age: float = 0.0):
+        """
+        Query the engine for the subaccount, reusing a recent snapshot.
+
+        Concurrent callers share a query that is already in flight.
+
+        Args:
+            max_age: Maximum age in seconds of a cached snapshot to return
+
+        Returns:
+            Raw SubaccountInfoData from the engine
+        """
+        if self._last_account_info is not None:
+            fetched_at, info = self._last_account_info
+            if time.monotonic() - fetched_at < max_age:
+                return info
+
+        if self._account_info_request is None or self._account_info_request.done():
+            self._account_info_request = asyncio.ensure_future(self._query_subaccount_info())
+        return await asyncio.shield(self._account_info_request)
+
+    async def _query_subaccount_info(self):
+        """
+        Run the subaccount query in a worker thread and remember the snapshot.
+
+        If a position_change arrived while the query was in flight, the
+        snapshot may predate it, so it is returned but neither cached nor
+        used to seed the positions mirror.
+        """
+        started = time.monotonic()
+        version = self._positions_version
+        info = await asyncio.to_thread(
+            self.client.context.engine_client.get_subaccount_info,
+            self._subaccount_hex
+        )
+
+        with self._stream_lock:
+            if self._positions_version == version:
+                self._last_account_info = (started, info)
+                if self._order_stream is not None:
+                    # Seed (or re-seed) the positions mirror kept current by the stream
+                    self._positions = {
+                        b.product_id: (b.balance.amount, b.balance.v_quote_balance)
+                        for b in info.perp_balances
+                    }
+        return info
+
+    def _balance_entry(self, product_id: int, amount_x18, v_quote_x18) -> Dict[str, Any]:
+        """
+        Convert an engine balance into a balance dict with unrealized PnL.
+
+        Args:
+            product_id: Product ID of the balance
+            amount_x18: Balance amount (x18, int or decimal string)
+            v_quote_x18: Perp v_quote balance (x18); unused for spot
+
+        Returns:
+            Dictionary with product_id, balance and unrealized_pnl
+        """
+        amount = int(amount_x18) / _X18 if amount_x18 != '0' else 0
+
+        # Calculate PnL for perp positions
+        unrealized_pnl = 0
+        current_price = self._perp_mark_prices.get(product_id) if amount != 0 else None
+        if current_price:
+            v_quote = int(v_quote_x18) / _X18
+
+            # PnL = position_value + v_quote_balance
+            position_value = amount * current_price
+            unrealized_pnl = position_value + v_quote
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug(
+                    "🔍 PnL for product %s: amount=%s price=%.2f v_quote=%.2f value=%.2f pnl=%.2f",
+                    product_id, amount, current_price, v_quote, position_value, unrealized_pnl
+                )
+
+        return {
+            'product_id': product_id,
+            'balance': amount,
+            'unrealized_pnl': unrealized_pnl
+        }
     
     async def buy_limit(
         self,
@@ -282,7 +1207,8 @@ class NadoTrader:
             time_in_force: GTC (Good Till Cancel), IOC (Immediate or Cancel), FOK (Fill or Kill)
             
         Returns:
-            Order result with order ID and status
+            Order result with order ID and status, or success False and an
+            error (also for orders rejected locally, e.g. below one lot)
         """
         return await self._place_limit_order(
             product_id=product_id,
@@ -315,7 +1241,8 @@ class NadoTrader:
             time_in_force: GTC (Good Till Cancel), IOC (Immediate or Cancel), FOK (Fill or Kill)
             
         Returns:
-            Order result with order ID and status
+            Order result with order ID and status, or success False and an
+            error (also for orders rejected locally, e.g. below one lot)
         """
         return await self._place_limit_order(
             product_id=product_id,
@@ -327,12 +1254,66 @@ class NadoTrader:
             time_in_force=time_in_force
         )
     
+    async def quote(
+        self,
+        product_id: int,
+        bid_price: float,
+        ask_price: float,
+        size: float,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Place a bid and an ask for the same product concurrently.
+        
+        Args:
+            product_id: Product ID
+            bid_price: Buy limit price
+            ask_price: Sell limit price
+            size: Order size for each side (positive value)
+            **kwargs: reduce_only, post_only, time_in_force (applied to both sides)
+            
+        Returns:
+            [buy result, sell result]; an unexpected exception is returned in
+            place of its result so one side failing doesn't hide the other
+        """
+        return await asyncio.gather(
+            self.buy_limit(product_id, bid_price, size, **kwargs),
+            self.sell_limit(product_id, ask_price, size, **kwargs),
+            return_exceptions=True
+        )
+    
+    async def quote_many(
+        self,
+        levels: List[Tuple[int, float, float, float]],
+        **kwargs
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Place several bid/ask pairs concurrently.
+        
+        Args:
+            levels: (product_id, bid_price, ask_price, size) tuples
+            **kwargs: reduce_only, post_only, time_in_force (applied to every order)
+            
+        Returns:
+            One [buy result, sell result] pair per level, in input order
+        """
+        results = await asyncio.gather(*(
+            coro
+            for product_id, bid_price, ask_price, size in levels
+            for coro in (
+                self.buy_limit(product_id, bid_price, size, **kwargs),
+                self.sell_limit(product_id, ask_price, size, **kwargs)
+            )
+        ), return_exceptions=True)
+        
+        return [results[i:i + 2] for i in range(0, len(results), 2)]
+    
     async def _place_limit_order(
         self,
         product_id: int,
         price: float,
         size: float,
-        side: OrderSide,
+        side: str,
         reduce_only: bool = False,
         post_only: bool = False,
         time_in_force: str = "GTC"
@@ -344,7 +1325,7 @@ class NadoTrader:
             product_id: Product ID
             price: Limit price
             size: Order size (positive)
-            side: BUY or SELL
+            side: OrderSide.BUY or OrderSide.SELL
             reduce_only: Only reduce existing position
             post_only: Must be maker order
             time_in_force: Order time in force
@@ -353,117 +1334,320 @@ class NadoTrader:
             Order placement result
         """
         self._ensure_connected()
+
+        # Place order using SDK
+        try:
+            # Invalid orders (below one lot, under the minimum value, ...)
+            # are reported like engine rejections, without being sent
+            place_order_params = self._build_order_params(
+                product_id, price, size, side, reduce_only, post_only, time_in_force
+            )
+
+            await self._throttle_order()
+
+            # The nonce carries a recv_time 90 s ahead, so it is only taken
+            # once the rate limiter has let the order through
+            place_order_params.order.nonce = self._next_nonce()
+
+            # The SDK call blocks, so it runs in a worker thread and concurrent
+            # placements (e.g. both sides of a quote) overlap their round-trips
+            if self._ws:
+                result = await asyncio.to_thread(
+                    self._execute_over_websocket, NadoExecuteType.PLACE_ORDER, place_order_params
+                )
+            else:
+                result = await asyncio.to_thread(self._place_order_http, place_order_params)
+
+            # Extract digest from the response
+            digest = result.data.digest if result.data else 'unknown'
+
+            order_info = self._record_placed_order(
+                digest, result.status, product_id, place_order_params.order, side
+            )
+
+            self._log.info("✓ Order placed: %s %s @ $%s", side, order_info['size'], order_info['price'])
+            return order_info
+            
+        except Exception as e:
+            self._log.error("✗ Error placing order: %s", e)
+            return {
+                'success': False,
+                'error': str(e),
+                'product_id': product_id,
+                'side': side,
+                'price': price,
+                'size': size
+            }
+
+    async def place_batch_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        stop_on_failure: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Place several limit orders with one request per batch of up to 50.
         
+        Args:
+            orders: Order dicts with product_id, price, size and side
+                ("buy"/"sell"), plus optional reduce_only, post_only and
+                time_in_force as in buy_limit()/sell_limit()
+            stop_on_failure: Stop processing a batch at its first rejected
+                order (orders already placed stay live)
+            
+        Returns:
+            One result per input order, in input order, shaped like the
+            buy_limit()/sell_limit() result
+        """
+        self._ensure_connected()
+
+        def failed(o: Dict[str, Any], error: str) -> Dict[str, Any]:
+            return {
+                'success': False,
+                'error': error,
+                'product_id': o['product_id'],
+                'side': o['side'],
+                'price': o['price'],
+                'size': abs(o['size'])
+            }
+
+        # The whole batch is signed within milliseconds, so one clock read
+        # serves every order's expiration
+        now = time.time_ns() // 1_000_000_000
+        results: List[Optional[Dict[str, Any]]] = [None] * len(orders)
+        params: Dict[int, PlaceOrderParams] = {}
+        for i, o in enumerate(orders):
+            try:
+                params[i] = self._build_order_params(
+                    o['product_id'],
+                    o['price'],
+                    abs(o['size']),
+                    o['side'],
+                    o.get('reduce_only', False),
+                    o.get('post_only', False),
+                    o.get('time_in_force', "GTC"),
+                    now
+                )
+            except ValueError as e:
+                # An invalid leg is reported on its own; the rest still go out
+                results[i] = failed(o, str(e))
+
+        valid = list(params)
+        batches = [
+            valid[start:start + self._MAX_BATCH_ORDERS]
+            for start in range(0, len(valid), self._MAX_BATCH_ORDERS)
+        ]
+
+        async def send(batch: List[int]):
+            # Rate limits count orders, not requests
+            await self._throttle_order(len(batch))
+            for i in batch:
+                params[i].order.nonce = self._next_nonce()
+            return await asyncio.to_thread(
+                self._place_orders_http, [params[i] for i in batch], stop_on_failure
+            )
+
+        responses = await asyncio.gather(*(send(b) for b in batches), return_exceptions=True)
+
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                self._log.error("✗ Error placing batch of %s orders: %s", len(batch), response)
+                items = []
+            else:
+                items = getattr(response.data, 'place_orders', None) or []
+
+            for k, i in enumerate(batch):
+                o = orders[i]
+                item = items[k] if k < len(items) else None
+                digest = getattr(item, 'digest', None)
+                error = getattr(item, 'error', None)
+
+                if digest and not error:
+                    results[i] = self._record_placed_order(
+                        digest, response.status, o['product_id'], params[i].order, o['side']
+                    )
+                    continue
+
+                if isinstance(response, Exception):
+                    error = str(response)
+                elif item is None:
+                    # Not processed: an earlier order failed with stop_on_failure
+                    error = error or "not processed"
+                results[i] = failed(o, error)
+
+        placed = sum(1 for r in results if r['success'])
+        self._log.info("✓ Batch placed: %s/%s orders", placed, len(orders))
+        return results
+
+    def _build_order_params(
+        self,
+        product_id: int,
+        price: float,
+        size: float,
+        side: str,
+        reduce_only: bool,
+        post_only: bool,
+        time_in_force: str,
+        now: Optional[int] = None
+    ) -> PlaceOrderParams:
+        """
+        Build unsigned PlaceOrderParams for a limit order.
+
+        Args:
+            product_id: Product ID
+            price: Limit price
+            size: Order size (positive)
+            side: OrderSide.BUY or OrderSide.SELL
+            reduce_only: Only reduce existing position
+            post_only: Must be maker order
+            time_in_force: GTC, IOC or FOK
+            now: Unix time in seconds that the expiration counts from; read
+                from the clock when omitted (batches share one read)
+
+        Returns:
+            PlaceOrderParams without a nonce; the caller stamps one with
+            _next_nonce() right before signing and sending
+
+        Raises:
+            ValueError: Unknown side or time in force, or an order the engine
+                would reject: size below one lot, price below one tick, or
+                value under the product's min_size
+        """
         # Convert to x18 format (Nado uses 18 decimal precision)
-        price_x18 = to_x18(price)
+        price_x18 = _to_x18_cached(price)
         
         # Amount is positive for buy, negative for sell
-        if side == OrderSide.BUY:
-            amount_x18 = to_x18(size)
-        else:
-            amount_x18 = to_x18(-size)
-        
-        # Build order appendix manually
-        # Appendix structure (128 bits):
-        # | value | reserved | trigger | reduce only | order type | isolated | version |
-        # | 64    | 50       | 2       | 1           | 2          | 1        | 8       |
-        # | 127..64 | 63..14 | 13..12  | 11          | 10..9      | 8        | 7..0    |
-        
-        version = 1  # Version 1
-        isolated = 0  # Cross margin (not isolated)
-        
-        # Order type: 0=DEFAULT, 1=IOC, 2=FOK, 3=POST_ONLY
-        if post_only:
-            order_type = 3
-        elif time_in_force == "IOC":
-            order_type = 1
-        elif time_in_force == "FOK":
-            order_type = 2
-        else:
-            order_type = 0
+        sign = self._SIGN_BY_SIDE.get(side)
+        if sign is None:
+            raise ValueError(f"Unsupported side: {side!r} (expected buy or sell)")
+        amount_x18 = _to_x18_cached(sign * size)
+
+        # The engine only accepts whole ticks and lots; snap in integer x18
+        # so float noise from price arithmetic can't get an order rejected
+        increments = self._perp_increments.get(product_id)
+        if increments is not None:
+            price_x18 = _round_to_increment(price_x18, increments[0])
+            amount_x18 = _round_to_increment(amount_x18, increments[1])
+
+        # Reject locally what the engine would reject (or accept as a no-op)
+        if amount_x18 == 0:
+            raise ValueError(f"Order size {size} rounds to zero lots for product {product_id}")
+        if price_x18 <= 0:
+            raise ValueError(f"Order price {price} rounds to zero ticks for product {product_id}")
+        min_size_x18 = self._perp_min_sizes.get(product_id)
+        if min_size_x18 and abs(amount_x18) * price_x18 < min_size_x18 * 10**18:
+            raise ValueError(
+                f"Order value ${abs(amount_x18) * price_x18 / _X18 / _X18:,.2f} is below the "
+                f"${min_size_x18 / _X18:,.2f} minimum for product {product_id}"
+            )
         
-        reduce_only_bit = 1 if reduce_only else 0
-        trigger_type = 0  # NONE (0=NONE, 1=PRICE, 2=TWAP, 3=TWAP_CUSTOM)
-
-        # Build the appendix as a 128-bit integer
-        appendix = (
-            version |
-            (isolated << 8) |
-            (order_type << 9) |
-            (reduce_only_bit << 11) |
-            (trigger_type << 12)
-        )
-
-        # Calculate expiration (30 days from now for GTC orders)
-        if time_in_force == "GTC":
-            expiration = int(time.time()) + (30 * 24 * 60 * 60)
-        else:
-            expiration = int(time.time()) + 300  # 5 minutes for IOC/FOK
+        # Appendix and expiry are precomputed for every supported flag
+        # combination; lowercase TIFs ("ioc") only pay for the retry
+        flags = self._ORDER_FLAGS.get((post_only, time_in_force, reduce_only))
+        if flags is None:
+            flags = self._ORDER_FLAGS.get((post_only, str(time_in_force).upper(), reduce_only))
+            if flags is None:
+                raise ValueError(f"Unsupported time_in_force: {time_in_force!r} (expected GTC, IOC or FOK)")
+        appendix, expires_in = flags
+
+        # Integer clock read; no float multiply/truncate on the order path
+        if now is None:
+            now = time.time_ns() // 1_000_000_000
+        expiration = now + expires_in
         
-        # Get wallet address and derive subaccount using the SDK utility
-        wallet_address = self.client.context.signer.address
-        subaccount_hex = subaccount_to_hex(wallet_address, self.subaccount_name)
-
         # Create OrderParams object
-        # Note: nonce is set to None to let the SDK auto-generate it with proper recv_time buffer
+        # Note: x18 values stay ints; EIP-712 signing needs ints and the SDK
+        # stringifies them itself only when building the request body
         order_params = OrderParams(
-            sender=subaccount_hex,
+            sender=self._subaccount_hex,  # Derived once in connect()
             priceX18=price_x18,
             amount=amount_x18,
             expiration=expiration,
-            nonce=None,  # SDK will auto-generate with 90-second recv_time buffer
+            nonce=None,  # Stamped at send time, after any rate-limit wait
             appendix=appendix
         )
 
         # Create PlaceOrderParams object
-        place_order_params = PlaceOrderParams(
+        return PlaceOrderParams(
             product_id=product_id,
             order=order_params
         )
 
-        # Place order using SDK
-        try:
-            result = self.client.market.place_order(params=place_order_params)
+    def _record_placed_order(
+        self,
+        digest: str,
+        status: str,
+        product_id: int,
+        order: OrderParams,
+        side: str
+    ) -> Dict[str, Any]:
+        """
+        Track an accepted order locally and build its result dict.
 
-            # Extract digest from the response
-            digest = result.data.digest if result.data else 'unknown'
+        Price and size are taken from the signed order, i.e. after snapping
+        to the product's tick and lot sizes, not from the caller's inputs.
 
-            order_info = {
-                'success': True,
-                'order_id': digest,
-                'product_id': product_id,
-                'side': side.value,
-                'price': price,
-                'size': size,
-                'status': result.status,
-                'timestamp': time.time()
-            }
+        Args:
+            digest: Order digest returned by the engine
+            status: Execute response status
+            product_id: Product ID
+            order: OrderParams that were sent
+            side: OrderSide.BUY or OrderSide.SELL
 
-            # Track this order locally until indexer picks it up
-            self._pending_orders[digest] = {
-                'digest': digest,
-                'product_id': product_id,
-                'price': price,
-                'amount': size if side == OrderSide.BUY else -size,
-                'filled': 0,
-                'side': side.value,
-                'timestamp': time.time(),
-                'local': True  # Mark as locally tracked
-            }
+        Returns:
+            Order placement result
+        """
+        now = time.time()  # One clock read for every timestamp below
+        price = order.priceX18 / _X18
+        amount = order.amount / _X18
+        size = abs(amount)
+        expiration = order.expiration
+
+        order_info = {
+            'success': True,
+            'order_id': digest,
+            'product_id': product_id,
+            'side': side,
+            'price': price,
+            'size': size,
+            'status': status,
+            'timestamp': now
+        }
 
-            print(f"✓ Order placed: {side.value.upper()} {size} @ ${price}")
-            return order_info
-            
-        except Exception as e:
-            print(f"✗ Error placing order: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
-                'product_id': product_id,
-                'side': side.value,
-                'price': price,
-                'size': size
-            }
+        # Balances may change once the order rests or fills
+        self._last_account_info = None
+
+        # Track this order locally until indexer picks it up
+        self._pending_orders[digest] = PendingOrder(
+            digest=digest,
+            product_id=product_id,
+            price=price,
+            amount=amount,
+            side=side,
+            timestamp=now
+        )
+
+        # IOC/FOK orders are done by the time the reply arrives, so only
+        # orders that can rest are mirrored
+        if self._order_stream is not None and _rests_on_book(order.appendix):
+            with self._stream_lock:
+                # The stream may have reported the fill or cancel before the
+                # placement reply came back; don't resurrect the order then
+                if digest in self._closed_digests:
+                    return order_info
+                self._open_orders_version += 1
+                # setdefault: a snapshot may already hold it
+                self._open_orders.setdefault(digest, {
+                    'digest': digest,
+                    'product_id': product_id,
+                    'price': price,
+                    'amount': amount,
+                    'unfilled_amount': size,
+                    'side': side,
+                    'placed_at': int(now),
+                    'expiration': expiration
+                })
+
+        return order_info
     
     async def cancel_order(self, product_id: int, order_digest: str) -> Dict[str, Any]:
         """
@@ -478,24 +1662,31 @@ class NadoTrader:
         """
         self._ensure_connected()
 
-        # Get wallet address and derive subaccount
-        wallet_address = self.client.context.signer.address
-        subaccount_hex = subaccount_to_hex(wallet_address, self.subaccount_name)
+        subaccount_hex = self._subaccount_hex
 
         try:
+            # Wait out the rate limit before taking the nonce (recv_time + 90 s)
+            await self._throttle_order()
+
             # Create CancelOrdersParams object
             cancel_params = CancelOrdersParams(
                 sender=subaccount_hex,
                 productIds=[product_id],
                 digests=[order_digest],
-                nonce=None  # Will be auto-generated
+                nonce=self._next_nonce()
             )
 
-            result = self.client.market.cancel_orders(params=cancel_params)
+            if self._ws:
+                result = await asyncio.to_thread(
+                    self._execute_over_websocket, NadoExecuteType.CANCEL_ORDERS, cancel_params
+                )
+            else:
+                result = await asyncio.to_thread(self.client.market.cancel_orders, params=cancel_params)
 
             # Remove from pending orders if it was locally tracked
             if order_digest in self._pending_orders:
                 del self._pending_orders[order_digest]
+            self._forget_open_orders(digest=order_digest)
 
             return {
                 'success': True,
@@ -503,7 +1694,7 @@ class NadoTrader:
                 'order_digest': order_digest
             }
         except Exception as e:
-            print(f"✗ Error cancelling order: {str(e)}")
+            self._log.error("✗ Error cancelling order: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -522,57 +1713,134 @@ class NadoTrader:
         """
         self._ensure_connected()
 
-        # Get wallet address and derive subaccount
-        wallet_address = self.client.context.signer.address
-        subaccount_hex = subaccount_to_hex(wallet_address, self.subaccount_name)
+        subaccount_hex = self._subaccount_hex
 
         try:
             if product_id is not None:
+                await self._throttle_order()
                 # Create CancelProductOrdersParams object
                 cancel_params = CancelProductOrdersParams(
                     sender=subaccount_hex,
                     productIds=[product_id],
-                    nonce=None  # Will be auto-generated
+                    nonce=self._next_nonce()
                 )
-                result = self.client.market.cancel_product_orders(params=cancel_params)
-                message = f"✓ Cancelled all orders for product {product_id}"
+                result = await asyncio.to_thread(self._cancel_product_orders, cancel_params)
+                self._log.info("✓ Cancelled all orders for product %s", product_id)
 
                 # Remove pending orders for this product
                 digests_to_remove = [
                     digest for digest, order in self._pending_orders.items()
-                    if order['product_id'] == product_id
+                    if order.product_id == product_id
                 ]
                 for digest in digests_to_remove:
                     del self._pending_orders[digest]
+                self._forget_open_orders({product_id})
             else:
-                # Cancel for all perpetual products
-                results = []
-                for product in self._products_cache['perp']:
+                # Cancel every perpetual product in a single signed request
+                product_ids = list(self._perp_by_id)
+                try:
+                    await self._throttle_order()
                     cancel_params = CancelProductOrdersParams(
                         sender=subaccount_hex,
-                        productIds=[product.product_id],
-                        nonce=None  # Will be auto-generated
+                        productIds=product_ids,
+                        nonce=self._next_nonce()
+                    )
+                    result = await asyncio.to_thread(self._cancel_product_orders, cancel_params)
+                    failed = {}
+                except Exception as e:
+                    # Fall back to one request per product so a single bad
+                    # product doesn't block cancelling the rest
+                    self._log.warning("⚠️  Bulk cancel failed (%s), retrying per product", e)
+                    result, failed = await self._cancel_products_individually(
+                        subaccount_hex, product_ids
                     )
-                    r = self.client.market.cancel_product_orders(params=cancel_params)
-                    results.append(r)
-                result = results
-                message = "✓ Cancelled all orders for all products"
 
-                # Clear all pending orders
-                self._pending_orders.clear()
+                # Remove pending orders for every product that was cancelled
+                digests_to_remove = [
+                    digest for digest, order in self._pending_orders.items()
+                    if order.product_id not in failed
+                ]
+                for digest in digests_to_remove:
+                    del self._pending_orders[digest]
+                self._forget_open_orders(set(product_ids) - set(failed))
+
+                if failed:
+                    error = f"Failed to cancel orders for products {sorted(failed)}"
+                    self._log.error("✗ Error cancelling orders: %s", error)
+                    return {
+                        'success': False,
+                        'error': error,
+                        'failed': failed,
+                        'result': result
+                    }
+                self._log.info("✓ Cancelled all orders for all products")
 
-            print(message)
             return {
                 'success': True,
                 'result': result
             }
         except Exception as e:
-            print(f"✗ Error cancelling orders: {str(e)}")
+            self._log.error("✗ Error cancelling orders: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
     
+    def _cancel_product_orders(self, params: CancelProductOrdersParams):
+        """
+        Send one bulk product cancel, over the order WebSocket when open.
+
+        Unlike a placement, a cancel is safe to repeat, so if the socket
+        fails mid-request the per-product HTTP fallback simply sends it again.
+        """
+        if self._ws:
+            return self._execute_over_websocket(NadoExecuteType.CANCEL_PRODUCT_ORDERS, params)
+        return self.client.market.cancel_product_orders(params=params)
+
+    async def _cancel_products_individually(
+        self,
+        subaccount_hex: str,
+        product_ids: List[int],
+        max_workers: int = 10
+    ) -> Tuple[Dict[int, Any], Dict[int, str]]:
+        """
+        Cancel orders with one request per product, issued concurrently.
+
+        Args:
+            subaccount_hex: Sender subaccount
+            product_ids: Products to cancel orders for
+            max_workers: Maximum cancel requests in flight at once
+
+        Returns:
+            Tuple of (results by product ID, error messages by failed product ID)
+        """
+        # Bounds the burst on the engine and the threads held by blocking calls
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def cancel_product(pid: int):
+            async with semaphore:
+                await self._throttle_order()
+                # The SDK call blocks, so each one runs in a worker thread
+                return await asyncio.to_thread(
+                    self._cancel_product_orders,
+                    CancelProductOrdersParams(
+                        sender=subaccount_hex,
+                        productIds=[pid],
+                        nonce=self._next_nonce()
+                    )
+                )
+
+        results = await asyncio.gather(
+            *(cancel_product(pid) for pid in product_ids),
+            return_exceptions=True
+        )
+
+        failed = {
+            pid: str(r) for pid, r in zip(product_ids, results)
+            if isinstance(r, Exception)
+        }
+        return dict(zip(product_ids, results)), failed
+
     async def get_order_by_digest(self, order_digest: str) -> Optional[Dict[str, Any]]:
         """
         Get order details by digest.
@@ -586,48 +1854,66 @@ class NadoTrader:
         self._ensure_connected()
 
         try:
-            orders_result = self.client.context.indexer_client.get_historical_orders_by_digest(
+            orders_result = await asyncio.to_thread(
+                self.client.context.indexer_client.get_historical_orders_by_digest,
                 digests=[order_digest]
             )
 
             if orders_result.orders and len(orders_result.orders) > 0:
                 order = orders_result.orders[0]
+                amount = int(order.amount) / _X18
                 return {
                     'digest': order.digest,
                     'product_id': order.product_id,
-                    'price': from_x18(order.price_x18),
-                    'amount': from_x18(order.amount),
-                    'base_filled': from_x18(order.base_filled),
-                    'quote_filled': from_x18(order.quote_filled),
-                    'side': 'buy' if float(order.amount) > 0 else 'sell',
+                    'price': int(order.price_x18) / _X18,
+                    'amount': amount,
+                    'base_filled': int(order.base_filled) / _X18,
+                    'quote_filled': int(order.quote_filled) / _X18,
+                    'side': 'buy' if amount > 0 else 'sell',
                     'timestamp': order.timestamp
                 }
             return None
         except Exception as e:
-            print(f"⚠️  Error querying order {order_digest[:16]}...: {e}")
+            self._log.warning("⚠️  Error querying order %s...: %s", order_digest[:16], e)
             return None
 
-    async def get_open_orders(self, product_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def get_open_orders(
+        self,
+        product_id: Optional[int] = None,
+        refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Get all open orders.
 
+        With stream_orders enabled, orders are served from the local mirror
+        kept up to date by the order_update stream once it has been seeded
+        from the engine.
+
         Args:
             product_id: Filter by product ID (None = all products)
+            refresh: Query the engine even if the local mirror is live
 
         Returns:
             List of open orders
         """
         self._ensure_connected()
 
-        # Get wallet address and derive subaccount using the SDK utility
-        wallet_address = self.client.context.signer.address
-        subaccount_hex = subaccount_to_hex(wallet_address, self.subaccount_name)
+        if self._order_stream is not None and self._open_orders_synced and not refresh:
+            with self._stream_lock:
+                return [
+                    dict(order) for order in self._open_orders.values()
+                    if product_id is None or order['product_id'] == product_id
+                ]
+
+        subaccount_hex = self._subaccount_hex
+        version = self._open_orders_version  # Before the query, see _sync_open_orders
 
         # Query open orders from engine (real-time, no lag)
         if product_id is not None:
             # Get orders for specific product
             # Returns SubaccountOpenOrdersData with .orders list
-            orders_result = self.client.context.engine_client.get_subaccount_open_orders(
+            orders_result = await asyncio.to_thread(
+                self.client.context.engine_client.get_subaccount_open_orders,
                 product_id=product_id,
                 sender=subaccount_hex
             )
@@ -635,8 +1921,9 @@ class NadoTrader:
         else:
             # Get orders for all perpetual products
             # Returns SubaccountMultiProductsOpenOrdersData with .product_orders list
-            all_product_ids = [p.product_id for p in self._products_cache['perp']]
-            orders_result = self.client.context.engine_client.get_subaccount_multi_products_open_orders(
+            all_product_ids = list(self._perp_by_id)
+            orders_result = await asyncio.to_thread(
+                self.client.context.engine_client.get_subaccount_multi_products_open_orders,
                 product_ids=all_product_ids,
                 sender=subaccount_hex
             )
@@ -655,7 +1942,7 @@ class NadoTrader:
         for order in orders_list:
             try:
                 # Convert amount to float for side determination
-                amount = from_x18(order.amount)
+                amount = int(order.amount) / _X18
 
                 # Engine returns OrderData objects with:
                 # - price_x18: price in x18 format
@@ -666,37 +1953,61 @@ class NadoTrader:
                 open_orders.append({
                     'digest': order.digest,
                     'product_id': order.product_id,
-                    'price': from_x18(order.price_x18),
+                    'price': int(order.price_x18) / _X18,
                     'amount': amount,
-                    'unfilled_amount': from_x18(order.unfilled_amount) if hasattr(order, 'unfilled_amount') else abs(amount),
+                    'unfilled_amount': int(order.unfilled_amount) / _X18 if hasattr(order, 'unfilled_amount') else abs(amount),
                     'side': 'buy' if amount > 0 else 'sell',
                     'placed_at': order.placed_at if hasattr(order, 'placed_at') else None,
                     'expiration': order.expiration if hasattr(order, 'expiration') else None
                 })
             except Exception as e:
                 # If we can't parse the order, skip it
-                print(f"⚠️  Skipping order: {e}")
+                self._log.warning("⚠️  Skipping order: %s", e)
                 continue
 
+        if self._order_stream is not None:
+            self._sync_open_orders([dict(order) for order in open_orders], product_id, version)
+
         return open_orders
     
-    async def get_positions(self) -> List[Dict[str, Any]]:
+    async def get_positions(self, max_age: float = 0.2) -> List[Dict[str, Any]]:
         """
         Get all open positions.
 
+        With stream_orders enabled, positions are served from the local
+        mirror kept current by the position_change stream once a subaccount
+        query has seeded it.
+
+        Args:
+            max_age: Reuse a subaccount snapshot up to this many seconds old
+                (0 = always query the engine)
+
         Returns:
             List of positions with details
         """
-        account_info = await self.get_account_info()
+        self._ensure_connected()
 
-        # Get valid perpetual product IDs
-        valid_product_ids = {p.product_id for p in self._products_cache['perp']}
+        with self._stream_lock:
+            mirrored = dict(self._positions) if self._positions is not None and max_age > 0 else None
+
+        if mirrored is None:
+            info = await self._fetch_subaccount_info(max_age)
+            # Spot balances can never be positions, so only perp balances are converted
+            perp_balances = [
+                (b.product_id, b.balance.amount, b.balance.v_quote_balance)
+                for b in info.perp_balances
+            ]
+        else:
+            perp_balances = [(pid, amount, v_quote) for pid, (amount, v_quote) in mirrored.items()]
 
         positions = []
-        for balance in account_info['balances']:
+        for product_id, amount_x18, v_quote_x18 in perp_balances:
             # Only show positions for active perpetual products with non-zero balance
-            if (balance['product_id'] in valid_product_ids and
-                balance['balance'] != 0):
+            if product_id not in self._perp_by_id or amount_x18 in ('0', 0):
+                continue
+
+            balance = self._balance_entry(product_id, amount_x18, v_quote_x18)
+            if balance['balance'] != 0:
                 positions.append({
                     'product_id': balance['product_id'],
                     'size': balance['balance'],
@@ -718,7 +2029,7 @@ class NadoTrader:
         """
         self._ensure_connected()
 
-        result = self.client.context.indexer_client.get_perp_funding_rate(product_id)
+        result = await asyncio.to_thread(self.client.context.indexer_client.get_perp_funding_rate, product_id)
 
         funding_rate = from_x18(int(result.funding_rate_x18))
 
@@ -728,20 +2039,175 @@ class NadoTrader:
             'update_time': result.update_time
         }
 
-    async def get_orderbook(self, product_id: int, depth: int = 10) -> Dict[str, Any]:
+    async def get_best_bid_offer(
+        self,
+        product_id: int,
+        ttl: float = 0.05,
+        max_age: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        Get the best bid and ask for a product.
+
+        While stream_best_bid_offers() is running, this is a local read of
+        the latest streamed quote. Otherwise (before the first update for
+        the product arrives, or when its last update is older than max_age)
+        it falls back to a depth-1 get_orderbook().
+
+        Args:
+            product_id: Product ID
+            ttl: Seconds an orderbook snapshot may be reused on the fallback path
+            max_age: Seconds a streamed quote is trusted after it arrived
+
+        Returns:
+            Dictionary with product_id, bid and ask (None for an empty side)
+        """
+        self._ensure_connected()
+
+        quote = self._best_bid_offers.get(product_id) if self._bbo_stream is not None else None
+        if quote is not None and time.monotonic() - quote[2] <= max_age:
+            bid, ask, _ = quote
+        else:
+            orderbook = await self.get_orderbook(product_id, depth=1, ttl=ttl)
+            bid = orderbook['bids'][0]['price'] if orderbook['bids'] else None
+            ask = orderbook['asks'][0]['price'] if orderbook['asks'] else None
+
+        return {
+            'product_id': product_id,
+            'bid': bid,
+            'ask': ask
+        }
+
+    async def get_funding_rates(self, product_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the current funding rates for several perpetual products.
+
+        All rates come back in a single indexer request instead of one
+        get_funding_rate() call per product.
+
+        Args:
+            product_ids: Product IDs to query (None = every perpetual product)
+
+        Returns:
+            Dictionary of product ID -> funding rate details as returned by
+            get_funding_rate(); products the indexer has no rate for are omitted
+        """
+        self._ensure_connected()
+
+        if product_ids is None:
+            product_ids = list(self._perp_by_id)
+
+        result = await asyncio.to_thread(
+            self.client.context.indexer_client.get_perp_funding_rates, product_ids
+        )
+
+        rates = {}
+        for rate in result.values():
+            # Entries may come back as parsed models or plain dicts
+            if isinstance(rate, dict):
+                product_id = int(rate['product_id'])
+                funding_rate_x18 = rate['funding_rate_x18']
+                update_time = rate.get('update_time')
+            else:
+                product_id = int(rate.product_id)
+                funding_rate_x18 = rate.funding_rate_x18
+                update_time = rate.update_time
+            rates[product_id] = {
+                'product_id': product_id,
+                'funding_rate': from_x18(int(funding_rate_x18)),
+                'update_time': update_time
+            }
+        return rates
+
+    async def get_orderbooks(
+        self,
+        product_ids: Optional[List[int]] = None,
+        depth: int = 10,
+        ttl: float = 0.05,
+        max_workers: int = 10
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get orderbooks for several products concurrently.
+
+        Args:
+            product_ids: Product IDs to query (None = every perpetual product)
+            depth: Number of price levels to retrieve per book
+            ttl: Seconds a snapshot may be reused, as in get_orderbook()
+            max_workers: Maximum orderbook requests in flight at once
+
+        Returns:
+            Dictionary of product ID -> orderbook as returned by get_orderbook();
+            a product whose request failed maps to {'success': False, 'error': ...}
+        """
+        self._ensure_connected()
+
+        if product_ids is None:
+            product_ids = list(self._perp_by_id)
+
+        # Bounds the burst on the engine and the threads held by blocking calls
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(pid: int):
+            async with semaphore:
+                return await self.get_orderbook(pid, depth=depth, ttl=ttl)
+
+        results = await asyncio.gather(
+            *(fetch(pid) for pid in product_ids),
+            return_exceptions=True
+        )
+
+        books = {}
+        for pid, book in zip(product_ids, results):
+            if isinstance(book, Exception):
+                self._log.warning("⚠️  Could not load orderbook for product %s: %s", pid, book)
+                book = {'success': False, 'error': str(book)}
+            books[pid] = book
+        return books
+
+    async def get_orderbook(self, product_id: int, depth: int = 10, ttl: float = 0.05) -> Dict[str, Any]:
         """
         Get orderbook for a product.
+
+        Snapshots are cached per (product_id, depth) for `ttl` seconds, and
+        concurrent callers share a single in-flight request. The returned
+        dict is shared between those callers, so treat it as read-only.
         
         Args:
             product_id: Product ID
             depth: Number of price levels to retrieve
+            ttl: Seconds a snapshot may be reused (0 = always fetch)
             
         Returns:
             Orderbook with bids and asks
         """
         self._ensure_connected()
-        
-        orderbook = self.client.market.get_market_depth(
+
+        key = (product_id, depth)
+        now = time.monotonic()
+        cached = self._orderbook_cache.get(key)
+        if cached is not None:
+            fetched_at, future = cached
+            # An in-flight request is always shared; a finished one only within ttl
+            if not future.done() or now - fetched_at < ttl:
+                return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._fetch_orderbook(product_id, depth))
+        self._orderbook_cache[key] = (now, future)
+
+        def _drop_failed(f: asyncio.Future):
+            # Don't serve a failed request to later callers
+            if (f.cancelled() or f.exception() is not None) and \
+                    self._orderbook_cache.get(key, (None, None))[1] is f:
+                del self._orderbook_cache[key]
+
+        future.add_done_callback(_drop_failed)
+        return await asyncio.shield(future)
+
+    async def _fetch_orderbook(self, product_id: int, depth: int) -> Dict[str, Any]:
+        """Fetch and convert an orderbook snapshot (see get_orderbook)."""
+        # The SDK call blocks, so run it in a worker thread to let other
+        # callers join this request while it is in flight
+        orderbook = await asyncio.to_thread(
+            self.client.market.get_market_depth,
             product_id=product_id,
             depth=depth
         )
@@ -749,16 +2215,47 @@ class NadoTrader:
         return {
             'product_id': product_id,
             'bids': [
-                {'price': from_x18(b.price_x18), 'size': from_x18(b.size_x18)}
-                for b in orderbook.bids[:depth]
+                {'price': float(b.price_x18) / _X18, 'size': float(b.size_x18) / _X18}
+                for b in itertools.islice(orderbook.bids, depth)
             ],
             'asks': [
-                {'price': from_x18(a.price_x18), 'size': from_x18(a.size_x18)}
-                for a in orderbook.asks[:depth]
+                {'price': float(a.price_x18) / _X18, 'size': float(a.size_x18) / _X18}
+                for a in itertools.islice(orderbook.asks, depth)
             ],
             'timestamp': time.time()
         }
     
+    def _next_nonce(self) -> int:
+        """
+        Generate an order/cancel nonce locally.
+
+        Same layout the SDK uses: recv_time in milliseconds (now + 90 s)
+        shifted left 20 bits. The low 20 bits are a per-millisecond sequence
+        instead of a random 0-999, so concurrent orders can never collide.
+
+        Returns:
+            Nonce for an order, cancel_orders or cancel_product_orders execute
+        """
+        recv_time_ms = time.time_ns() // 1_000_000 + 90_000
+
+        with self._nonce_lock:
+            if recv_time_ms > self._nonce_ms:
+                self._nonce_ms = recv_time_ms
+                self._nonce_seq = 0
+            else:
+                # Same millisecond (or the clock stepped back): keep increasing
+                self._nonce_seq += 1
+                if self._nonce_seq >= 1 << 20:
+                    self._nonce_ms += 1
+                    self._nonce_seq = 0
+
+            return (self._nonce_ms << 20) | self._nonce_seq
+
+    async def _throttle_order(self, count: int = 1):
+        """Wait for the order rate limiter to admit `count` orders, if one is configured."""
+        if self._order_bucket is not None:
+            await self._order_bucket.acquire(count)
+
     def _ensure_connected(self):
         """Ensure client is connected."""
         if not self.client:
@@ -775,6 +2272,25 @@ class NadoTrader:
 
 
 # Example usage
+def run(coro):
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    Drop-in replacement for asyncio.run() for scripts built on NadoTrader;
+    without uvloop it is exactly asyncio.run().
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 async def main():
     """Example usage of the Nado trading module."""
     
@@ -800,9 +2316,11 @@ async def main():
 
         # Display all available products
         print(f"\n📊 Available Products: {len(products)}")
+        rows = []
         for p in products:
             price_str = f"${p['price']:>10,.2f}" if p['price'] else "N/A".rjust(10)
-            print(f"  ID: {p['product_id']:2d} | {p['symbol']:8s} | Price: {price_str}")
+            rows.append(f"  ID: {p['product_id']:2d} | {p['symbol']:8s} | Price: {price_str}")
+        print("\n".join(rows))
 
         # Example: Place a buy limit order (LONG)
         # buy_order = await trader.buy_limit(
@@ -830,13 +2348,15 @@ async def main():
         if len(open_orders) == 0:
             print("  No open orders")
         else:
+            rows = []
             for order in open_orders:
-                size = abs(float(order['amount']))
-                unfilled = float(order.get('unfilled_amount', size))
-                price = float(order['price'])
+                size = abs(order['amount'])
+                unfilled = order.get('unfilled_amount', size)
+                price = order['price']
                 order_value = unfilled * price
                 market = product_map.get(order['product_id'], f"Product {order['product_id']}")
-                print(f"  {market:8s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Unfilled: {unfilled:>8.4f} | Price: ${price:>8.2f} | Value: ${order_value:>10.2f}")
+                rows.append(f"  {market:8s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Unfilled: {unfilled:>8.4f} | Price: ${price:>8.2f} | Value: ${order_value:>10.2f}")
+            print("\n".join(rows))
 
         # Get all open positions
         positions = await trader.get_positions()
@@ -845,12 +2365,14 @@ async def main():
         if len(positions) == 0:
             print("  No open positions")
         else:
+            rows = []
             for pos in positions:
                 market = product_map.get(pos['product_id'], f"Product {pos['product_id']}")
                 size = abs(pos['size'])
                 pnl = pos['unrealized_pnl']
                 pnl_str = f"${pnl:>10.2f}" if pnl != 0 else "$      0.00"
-                print(f"  {market:8s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | Unrealized PnL: {pnl_str}")
+                rows.append(f"  {market:8s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | Unrealized PnL: {pnl_str}")
+            print("\n".join(rows))
 
         # Cancel all orders
         # await trader.cancel_all_orders(product_id=8)
@@ -858,5 +2380,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # Run the example
-    asyncio.run(main())
+    run(main())
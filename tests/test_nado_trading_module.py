@@ -0,0 +1,342 @@
+"""NadoTrader order paths, with the network calls replaced."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("nado_protocol")
+
+from eth_account import Account
+from nado_protocol.contracts.types import NadoExecuteType
+from nado_protocol.engine_client import EngineClient, EngineClientOpts
+from nado_protocol.engine_client.types.execute import CancelOrdersParams
+from nado_protocol.utils.bytes32 import subaccount_to_hex
+
+import nado_trading_module
+from nado_trading_module import NadoTrader
+
+
+class FakeSubscriptionClient:
+    """Records control messages; the reader thread sees a closed stream."""
+
+    def __init__(self, acks=None):
+        self.acks = acks or {}
+        self.calls = []
+
+    def __call__(self, url):
+        return self
+
+    def connect(self):
+        return self
+
+    def authenticate(self, auth):
+        self.calls.append(('authenticate',))
+        return self.acks.get('authenticate', {'id': 1})
+
+    def subscribe_multi(self, streams):
+        self.calls.append(('subscribe_multi', [s.type for s in streams]))
+        return self.acks.get('subscribe_multi', {'id': 2})
+
+    def listen(self):
+        return iter(())
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def trader():
+    trader = NadoTrader("0x" + "11" * 32)
+    # Stand-in for connect(): no client calls are made by these tests
+    trader.client = SimpleNamespace()
+    trader._subaccount_hex = subaccount_to_hex("0x" + "22" * 20, "default")
+    return trader
+
+
+@pytest.fixture
+def engine(trader):
+    """Offline SDK engine client: signs locally, never sends."""
+    account = Account.from_key("0x" + "11" * 32)
+    engine = EngineClient(EngineClientOpts(
+        url="https://engine.invalid", signer=account, chain_id=57073, endpoint_addr="0x" + "33" * 20
+    ))
+    trader.client = SimpleNamespace(context=SimpleNamespace(engine_client=engine))
+    trader._subaccount_hex = subaccount_to_hex(account.address, "default")
+    return engine
+
+
+def test_batch_nonces_are_taken_after_the_rate_limit(trader, monkeypatch):
+    events = []
+
+    async def throttle(count=1):
+        events.append(('throttle', count))
+
+    def next_nonce():
+        events.append('nonce')
+        return len(events)
+
+    def place_orders(orders, stop_on_failure):
+        events.append(('send', [o.order.nonce for o in orders]))
+        return SimpleNamespace(data=None)
+
+    monkeypatch.setattr(trader, '_throttle_order', throttle)
+    monkeypatch.setattr(trader, '_next_nonce', next_nonce)
+    monkeypatch.setattr(trader, '_place_orders_http', place_orders)
+
+    asyncio.run(trader.place_batch_orders([
+        {'product_id': 2, 'price': 60000.0, 'size': 0.01, 'side': 'buy'},
+        {'product_id': 2, 'price': 61000.0, 'size': 0.01, 'side': 'sell'},
+    ]))
+
+    assert events == [('throttle', 2), 'nonce', 'nonce', ('send', [2, 3])]
+
+
+@pytest.fixture
+def btc_perp(trader):
+    # $1 ticks, 0.001 lots, $10 minimum order value
+    trader._perp_increments[2] = (10**18, 10**15)
+    trader._perp_min_sizes[2] = 10 * 10**18
+    return 2
+
+
+def test_order_is_recorded_with_snapped_price_and_size(trader, btc_perp, monkeypatch):
+    sent = []
+
+    def place_order(params):
+        sent.append(params.order)
+        return SimpleNamespace(status='success', data=SimpleNamespace(digest='0xabc'))
+
+    monkeypatch.setattr(trader, '_place_order_http', place_order)
+
+    result = asyncio.run(trader.buy_limit(btc_perp, 60000.4, 0.0104))
+
+    assert sent[0].priceX18 == 60000 * 10**18
+    assert sent[0].amount == 10 * 10**15
+    assert result['success']
+    assert (result['price'], result['size']) == (60000.0, 0.01)
+    pending = trader._pending_orders['0xabc']
+    assert (pending.price, pending.amount) == (60000.0, 0.01)
+
+
+def test_order_rounding_to_zero_lots_is_rejected(trader, btc_perp):
+    result = asyncio.run(trader.sell_limit(btc_perp, 60000.6, 0.0004))
+
+    assert not result['success']
+    assert "zero lots" in result['error']
+
+
+def test_order_below_minimum_value_is_rejected(trader, btc_perp):
+    result = asyncio.run(trader.buy_limit(btc_perp, 5000.0, 0.001))
+
+    assert not result['success']
+    assert "minimum" in result['error']
+
+
+def test_invalid_batch_leg_fails_alone(trader, btc_perp, monkeypatch):
+    sent = []
+
+    def place_orders(orders, stop_on_failure):
+        sent.extend(orders)
+        return SimpleNamespace(status='success', data=SimpleNamespace(
+            place_orders=[SimpleNamespace(digest='0xabc', error=None)]
+        ))
+
+    monkeypatch.setattr(trader, '_place_orders_http', place_orders)
+
+    results = asyncio.run(trader.place_batch_orders([
+        {'product_id': btc_perp, 'price': 60000.0, 'size': 0.0001, 'side': 'buy'},
+        {'product_id': btc_perp, 'price': 61000.0, 'size': 0.01, 'side': 'sell'},
+    ]))
+
+    assert len(sent) == 1
+    assert not results[0]['success'] and "zero lots" in results[0]['error']
+    assert results[1]['success'] and results[1]['order_id'] == '0xabc'
+
+
+def test_order_stream_subscribes_with_one_request(trader, monkeypatch):
+    client = FakeSubscriptionClient()
+    monkeypatch.setattr(nado_trading_module, 'NadoSubscriptionClient', client)
+    monkeypatch.setattr(trader, '_sign_stream_authentication', lambda: None)
+    trader.client = SimpleNamespace(context=SimpleNamespace(engine_client=SimpleNamespace(url="https://x")))
+
+    trader._connect_order_stream()
+
+    assert client.calls == [
+        ('authenticate',),
+        ('subscribe_multi', ['order_update', 'position_change'])
+    ]
+
+
+def test_order_stream_rejected_subscription_is_not_used(trader, monkeypatch):
+    client = FakeSubscriptionClient(acks={'subscribe_multi': {'id': 2, 'error': "unauthorized"}})
+    monkeypatch.setattr(nado_trading_module, 'NadoSubscriptionClient', client)
+    monkeypatch.setattr(trader, '_sign_stream_authentication', lambda: None)
+    trader.client = SimpleNamespace(context=SimpleNamespace(engine_client=SimpleNamespace(url="https://x")))
+
+    trader._connect_order_stream()
+
+    assert trader._order_stream is None
+
+
+def test_order_update_without_amount_unsyncs_the_mirror(trader):
+    trader._open_orders = {'0xabc': {'digest': '0xabc', 'product_id': 2, 'unfilled_amount': 0.01}}
+    trader._open_orders_synced = True
+
+    trader._apply_order_update({'digest': '0xabc', 'product_id': 2, 'reason': 'filled'})
+
+    assert '0xabc' in trader._open_orders
+    assert not trader._open_orders_synced
+
+
+def test_bbo_stream_subscribes_every_product_with_one_request(trader, monkeypatch):
+    client = FakeSubscriptionClient()
+    monkeypatch.setattr(nado_trading_module, 'NadoSubscriptionClient', client)
+    trader.client = SimpleNamespace(context=SimpleNamespace(engine_client=SimpleNamespace(url="https://x")))
+
+    trader._connect_bbo_stream([2, 4, 6])
+
+    assert client.calls == [('subscribe_multi', ['best_bid_offer'] * 3)]
+
+
+def test_stale_streamed_quote_falls_back_to_orderbook(trader, monkeypatch):
+    async def get_orderbook(product_id, depth, ttl):
+        return {'bids': [{'price': 59999.0}], 'asks': [{'price': 60001.0}]}
+
+    monkeypatch.setattr(trader, 'get_orderbook', get_orderbook)
+    trader._bbo_stream = object()
+    now = nado_trading_module.time.monotonic()
+
+    trader._best_bid_offers[2] = (60000.0, 60002.0, now)
+    fresh = asyncio.run(trader.get_best_bid_offer(2))
+    trader._best_bid_offers[2] = (60000.0, 60002.0, now - 1.0)
+    stale = asyncio.run(trader.get_best_bid_offer(2))
+
+    assert (fresh['bid'], fresh['ask']) == (60000.0, 60002.0)
+    assert (stale['bid'], stale['ask']) == (59999.0, 60001.0)
+
+
+class FakeOrderSocket:
+    """NadoWebSocketClient stand-in whose connection fails or answers."""
+
+    def __init__(self, fail=False):
+        self.ws = self
+        self.fail = fail
+        self.closed = False
+        self.recv_timeout = None
+
+    def send(self, message):
+        if self.fail:
+            raise ConnectionError("socket dropped")
+
+    def recv(self, timeout=None):
+        self.recv_timeout = timeout
+        return '{"status": "success", "signature": "0x", "request_type": "execute_cancel_orders"}'
+
+    def close(self):
+        self.closed = True
+
+
+def cancel_params(trader):
+    return CancelOrdersParams(
+        sender=trader._subaccount_hex, productIds=[2], digests=["0x" + "ab" * 32], nonce=trader._next_nonce()
+    )
+
+
+def test_websocket_dropped_by_another_thread_sends_over_http(trader, engine, monkeypatch):
+    executed = []
+    monkeypatch.setattr(engine, 'execute', lambda params: executed.append(params) or "http")
+
+    result = trader._execute_over_websocket(NadoExecuteType.CANCEL_ORDERS, cancel_params(trader))
+
+    assert result == "http"
+    assert executed[0].signature
+
+
+def test_websocket_failure_closes_only_that_socket(trader, engine):
+    socket = FakeOrderSocket(fail=True)
+    trader._ws = socket
+
+    with pytest.raises(ConnectionError):
+        trader._execute_over_websocket(NadoExecuteType.CANCEL_ORDERS, cancel_params(trader))
+
+    assert socket.closed
+    assert trader._ws is None
+
+
+def test_websocket_reply_wait_is_bounded(trader, engine):
+    socket = FakeOrderSocket()
+    trader._ws = socket
+
+    trader._execute_over_websocket(NadoExecuteType.CANCEL_ORDERS, cancel_params(trader))
+
+    assert socket.recv_timeout == trader._WS_REPLY_TIMEOUT
+
+
+@pytest.fixture
+def mirrored(trader):
+    """Trader whose open-orders mirror is live, as with stream_orders=True."""
+    trader._order_stream = object()
+    trader._open_orders_synced = True
+    return trader
+
+
+def test_immediate_orders_are_not_mirrored(mirrored, monkeypatch):
+    monkeypatch.setattr(mirrored, '_place_order_http', lambda params: SimpleNamespace(
+        status='success', data=SimpleNamespace(digest='0xabc')
+    ))
+
+    asyncio.run(mirrored.buy_limit(2, 60000.0, 0.01, time_in_force="IOC"))
+
+    assert '0xabc' not in mirrored._open_orders
+
+
+def test_fill_seen_before_the_placement_reply_is_not_resurrected(mirrored, monkeypatch):
+    def place_order(params):
+        # The stream reports the fill while the HTTP reply is still on its way
+        mirrored._apply_order_update({'digest': '0xabc', 'product_id': 2, 'amount': '0', 'reason': 'filled'})
+        return SimpleNamespace(status='success', data=SimpleNamespace(digest='0xabc'))
+
+    monkeypatch.setattr(mirrored, '_place_order_http', place_order)
+
+    asyncio.run(mirrored.buy_limit(2, 60000.0, 0.01))
+
+    assert asyncio.run(mirrored.get_open_orders()) == []
+
+
+def test_snapshot_that_raced_an_event_is_not_applied(mirrored):
+    mirrored._open_orders_synced = False
+    version = mirrored._open_orders_version
+    mirrored._apply_order_update({'digest': '0xabc', 'product_id': 2, 'reason': 'cancelled'})
+
+    mirrored._sync_open_orders([{'digest': '0xabc', 'product_id': 2}], None, version)
+
+    assert mirrored._open_orders == {}
+    assert not mirrored._open_orders_synced
+
+
+def test_subaccount_snapshot_that_raced_a_position_change_is_not_kept(trader):
+    def get_subaccount_info(subaccount):
+        # A position_change lands while the query is in flight
+        trader._apply_position_change({'product_id': 2, 'amount': '1', 'v_quote_amount': '-1'})
+        return SimpleNamespace(perp_balances=[])
+
+    trader.client = SimpleNamespace(context=SimpleNamespace(
+        engine_client=SimpleNamespace(get_subaccount_info=get_subaccount_info)
+    ))
+    trader._order_stream = object()
+
+    asyncio.run(trader._query_subaccount_info())
+
+    assert trader._last_account_info is None
+    assert trader._positions is None
+
+
+def test_warm_up_enables_the_cached_signer_on_products_with_a_minimum(trader, engine):
+    trader._perp_by_id = {2: object()}
+    trader._perp_increments[2] = (10**18, 10**15)
+    trader._perp_min_sizes[2] = 10 * 10**18
+
+    trader._warm_up_order_signing()
+
+    assert trader._order_signer is not None
@@ -0,0 +1,94 @@
+"""Drive TradingMenu.run() with canned input against a stub trader."""
+
+import asyncio
+import builtins
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("nado_protocol")
+
+
+class StubTrader:
+    """Just enough of NadoTrader for the menu to start, quote and quit."""
+
+    def __init__(self, **kwargs):
+        self.disconnected = False
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        self.disconnected = True
+
+    async def stream_best_bid_offers(self, product_ids):
+        pass
+
+    async def get_best_bid_offer(self, product_id, ttl=None):
+        return {'bid': 59990.0, 'ask': 60010.0}
+
+    async def get_open_orders(self):
+        return []
+
+    async def get_positions(self):
+        return []
+
+    def get_perpetual_products(self):
+        return [{
+            'product_id': 2,
+            'symbol': 'BTC-PERP',
+            'price': 60000.0,
+            'max_leverage': 20.0,
+            'tick_size': 1.0,
+            'lot_size': 0.001,
+            'min_size': 10.0
+        }]
+
+
+@pytest.fixture
+def trading_menu(monkeypatch):
+    config = types.ModuleType("config")
+    config.PRIVATE_KEY = "0x" + "11" * 32
+    config.MODE = None
+    config.SUBACCOUNT_NAME = "default"
+    config.DEFAULT_PRODUCT_ID = 2
+    config.DEFAULT_ORDER_SIZE = 0.001
+    config.PRICE_OFFSET_USD = 10.0
+    config.POST_ONLY = True
+    config.REDUCE_ONLY = False
+    config.TIME_IN_FORCE = "GTC"
+    monkeypatch.setitem(sys.modules, "config", config)
+    monkeypatch.delitem(sys.modules, "trading_menu", raising=False)
+
+    import trading_menu
+    monkeypatch.setattr(trading_menu, "NadoTrader", StubTrader)
+    return trading_menu
+
+
+def run_with_input(monkeypatch, module, lines):
+    answers = iter(lines)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    menu = module.TradingMenu()
+    asyncio.run(menu.run())
+    return menu
+
+
+def test_run_quits_from_main_menu(trading_menu, monkeypatch, capsys):
+    menu = run_with_input(monkeypatch, trading_menu, ["9", "", "0"])
+
+    out = capsys.readouterr().out
+    assert "Invalid choice" in out
+    assert "Goodbye" in out
+    assert "Error" not in out
+    assert menu.trader.disconnected
+
+
+def test_run_walks_buy_prompts(trading_menu, monkeypatch, capsys):
+    # Product, size and price defaults, decline the order, then quit
+    run_with_input(monkeypatch, trading_menu, ["2", "", "", "", "n", "", "0"])
+
+    out = capsys.readouterr().out
+    assert "Order Summary" in out
+    assert "Order cancelled" in out
+    assert "Goodbye" in out
@@ -7,18 +7,29 @@ Features:
 - View available products and prices
 - Place buy limit orders
 - Place sell limit orders (close positions)
+- Place several limit orders in one batch request
 - Cancel all open orders
 - Settings loaded from config.py
 
 Usage:
     python trading_menu.py
+
+Scripted orders skip the prompts but use the same config.py settings:
+    menu = TradingMenu()
+    await menu.initialize()
+    await menu.quick_buy(product_id, size, price)
 """
 
 import asyncio
+import io
+import logging
 import sys
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
 
-from nado_trading_module import NadoTrader
+from nado_trading_module import NadoTrader, run
 
 # Import configuration
 try:
@@ -42,13 +53,76 @@ if PRIVATE_KEY == 'your_private_key_here':
     sys.exit(1)
 
 
+@contextmanager
+def _batched_output():
+    """
+    Collect everything printed inside the block and write it out at once.
+
+    On a terminal, stdout is line-buffered, so each print() is its own
+    write. Only wrap code that doesn't await or prompt: the prompt thread
+    writes to the same sys.stdout.
+    """
+    buffer = io.StringIO()
+    stdout = sys.stdout
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
+
+class _Coalesced:
+    """
+    Wrap an async query so rapid repeat calls share one request.
+
+    Calls made while a request is in flight await that request, and calls
+    within `ttl` seconds of it completing get its result.
+    """
+
+    def __init__(self, fn, ttl: float = 0.5):
+        self.fn = fn
+        self.ttl = ttl
+        self._task: Optional[asyncio.Task] = None
+        self._fetched_at = 0.0
+
+    async def __call__(self):
+        task = self._task
+        if task is None or (task.done() and time.monotonic() - self._fetched_at >= self.ttl):
+            task = self._task = asyncio.ensure_future(self.fn())
+            task.add_done_callback(self._finished)
+        return await asyncio.shield(task)
+
+    def _finished(self, task: asyncio.Task):
+        if task is not self._task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            self._task = None  # Retry on the next call instead of replaying the error
+        else:
+            self._fetched_at = time.monotonic()
+
+    def invalidate(self):
+        """Make the next call issue a fresh request."""
+        self._task = None
+
+
 class TradingMenu:
     """Interactive trading menu for Nado exchange."""
 
+    # Seconds an orderbook snapshot may be reused between menu actions when
+    # the best bid/offer stream isn't available
+    BOOK_MAX_AGE = 0.25
+
     def __init__(self):
         self.trader: Optional[NadoTrader] = None
         self.products = []
         self.product_map = {}
+        self.symbol_by_pid = {}
+        # Repeated presses of the view options reuse one request
+        self._open_orders: Optional[_Coalesced] = None
+        self._positions: Optional[_Coalesced] = None
+        self._products_table: Optional[str] = None  # Rendered once; prices are fixed at connect
 
     async def initialize(self):
         """Initialize connection to Nado exchange."""
@@ -63,10 +137,54 @@ class TradingMenu:
         )
 
         await self.trader.connect()
+        self._open_orders = _Coalesced(self.trader.get_open_orders)
+        self._positions = _Coalesced(self.trader.get_positions)
 
         # Load products
         self.products = self.trader.get_perpetual_products()
         self.product_map = {p['product_id']: p for p in self.products}
+        self.symbol_by_pid = {pid: p['symbol'] for pid, p in self.product_map.items()}
+        self._products_table = None
+
+        # Follow every product's best bid/ask so the order flows can show the
+        # market without a request; without it they fall back to the orderbook
+        await self.trader.stream_best_bid_offers(list(self.product_map))
+
+    async def _best_bid_offer(self, product_id: int):
+        """Get the best bid/ask from the stream, or a snapshot up to BOOK_MAX_AGE seconds old."""
+        # NadoTrader already caches snapshots per (product_id, depth) and
+        # shares in-flight requests; the menu only needs a longer TTL
+        return await self.trader.get_best_bid_offer(product_id, ttl=self.BOOK_MAX_AGE)
+
+    async def ainput(self, prompt: str = "") -> str:
+        """
+        Read a line from the user without blocking the event loop.
+
+        The read runs in a daemon thread, so streams and in-flight requests
+        keep being serviced while the user types, and an interrupted prompt
+        doesn't keep the process alive waiting for Enter.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def deliver(set_outcome, value):
+            if not future.done():
+                set_outcome(value)
+
+        def read():
+            try:
+                line = input(prompt)
+            except BaseException as e:  # EOFError on closed stdin, etc.
+                outcome = (future.set_exception, e)
+            else:
+                outcome = (future.set_result, line)
+            try:
+                loop.call_soon_threadsafe(deliver, *outcome)
+            except RuntimeError:
+                pass  # Loop already closed; nobody is waiting for the line
+
+        threading.Thread(target=read, name="menu-input", daemon=True).start()
+        return await future
 
     async def cleanup(self):
         """Cleanup and disconnect."""
@@ -85,95 +203,199 @@ class TradingMenu:
         print("5) View open orders")
         print("6) View open positions")
         print("7) View funding rate")
+        print("8) Place multiple limit orders (batch)")
         print("0) Exit")
         print("-"*60)
 
     async def show_products_info(self):
         """Display information about available products."""
-        # Get account information first
-        try:
-            account_info = await self.trader.get_account_info()
-            health = account_info.get('health')
+        # Account, open orders and positions are independent queries, so
+        # fetch them together; each section reports its own failure
+        account_info, open_orders, positions = await asyncio.gather(
+            self.trader.get_account_info(),
+            self._open_orders(),
+            self._positions(),  # Same method as option 6
+            return_exceptions=True
+        )
 
+        # Emit the whole overview in one write (no awaits in here)
+        with _batched_output():
             # Display account balances
             print("\n" + "="*60)
             print("💰 Account Information")
             print("="*60)
 
-            # Extract margin information from health
-            from nado_protocol.utils.math import from_x18
-            available_margin = None
-            total_equity = None
-
-            if health and len(health) >= 3:
-                # Health[0] = Initial health (available margin for new positions)
-                # Health[1] = Maintenance health
-                # Health[2] = Total equity
-                if hasattr(health[0], 'health'):
-                    available_margin = from_x18(int(health[0].health))
-                if hasattr(health[2], 'health'):
-                    total_equity = from_x18(int(health[2].health))
-
-            # Display margin information
-            if available_margin is not None:
-                print(f"\n  {'Available Margin:':25s} ${available_margin:>15,.2f}")
-            if total_equity is not None:
-                print(f"  {'Total Account Value:':25s} ${total_equity:>15,.2f}")
-
-            # Get open orders
-            open_orders = await self.trader.get_open_orders()
+            if isinstance(account_info, Exception):
+                print(f"\n⚠️  Could not fetch account balance: {account_info}")
+            else:
+                health = account_info.get('health')
+
+                # Extract margin information from health
+                from nado_protocol.utils.math import from_x18
+                available_margin = None
+                total_equity = None
+
+                if health and len(health) >= 3:
+                    # Health[0] = Initial health (available margin for new positions)
+                    # Health[1] = Maintenance health
+                    # Health[2] = Total equity
+                    if hasattr(health[0], 'health'):
+                        available_margin = from_x18(int(health[0].health))
+                    if hasattr(health[2], 'health'):
+                        total_equity = from_x18(int(health[2].health))
+
+                # Display margin information
+                if available_margin is not None:
+                    print(f"\n  {'Available Margin:':25s} ${available_margin:>15,.2f}")
+                if total_equity is not None:
+                    print(f"  {'Total Account Value:':25s} ${total_equity:>15,.2f}")
 
             # Show open orders
-            if open_orders:
+            if isinstance(open_orders, Exception):
+                print(f"\n⚠️  Could not fetch open orders: {open_orders}")
+            elif open_orders:
                 print(f"\n  Open Orders: ({len(open_orders)})")
+                symbols = self.symbol_by_pid
+                rows = []
                 for order in open_orders:
-                    size = abs(float(order['amount']))
-                    unfilled = float(order.get('unfilled_amount', size))
-                    price = float(order['price'])
-                    product_symbol = self.product_map.get(order['product_id'], {}).get('symbol', f"Product {order['product_id']}")
-                    print(f"    {product_symbol:10s} | {order['side'].upper():4s} | Size: {unfilled:>8.4f} | Price: ${price:>10,.2f}")
+                    size = abs(order['amount'])
+                    unfilled = order.get('unfilled_amount', size)
+                    price = order['price']
+                    product_symbol = symbols.get(order['product_id']) or f"Product {order['product_id']}"
+                    rows.append(f"    {product_symbol:10s} | {order['side'].upper():4s} | Size: {unfilled:>8.4f} | Price: ${price:>10,.2f}")
+                print("\n".join(rows))
             else:
                 print(f"\n  No open orders")
 
-            # Get positions using the dedicated method (same as option 6)
-            positions = await self.trader.get_positions()
-
             # Show perpetual positions
-            if positions:
+            if isinstance(positions, Exception):
+                print(f"\n⚠️  Could not fetch positions: {positions}")
+            elif positions:
                 print(f"\n  Open Positions: ({len(positions)})")
+                symbols = self.symbol_by_pid
+                rows = []
                 for pos in positions:
-                    product_symbol = self.product_map.get(pos['product_id'], {}).get('symbol', f"Product {pos['product_id']}")
+                    product_symbol = symbols.get(pos['product_id']) or f"Product {pos['product_id']}"
                     size = abs(pos['size'])
                     pnl = pos['unrealized_pnl']
-                    print(f"    {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | PnL: ${pnl:>10.2f}")
+                    rows.append(f"    {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | PnL: ${pnl:>10.2f}")
+                print("\n".join(rows))
             else:
                 print(f"\n  No open positions")
 
             print("="*60)
 
-        except Exception as e:
-            print(f"\n⚠️  Could not fetch account balance: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # Display products information
-        print("\n" + "="*60)
-        print(f"📊 Available Products: {len(self.products)}")
-        print("="*60)
-
-        for p in self.products:
-            price_str = f"${p['price']:>10,.2f}" if p['price'] else "N/A".rjust(10)
-
-            # Format leverage information
-            leverage_str = f"{p['max_leverage']:>4.0f}x" if p.get('max_leverage') else " N/A"
-
-            default_marker = " ⭐" if p['product_id'] == DEFAULT_PRODUCT_ID else ""
-            print(f"  ID: {p['product_id']:2d} | {p['symbol']:10s} | Price: {price_str} | Max Leverage: {leverage_str}{default_marker}")
-
-        if DEFAULT_PRODUCT_ID in self.product_map:
-            print(f"\n⭐ Default trading product: {self.product_map[DEFAULT_PRODUCT_ID]['symbol']} (ID: {DEFAULT_PRODUCT_ID})")
+            # Display products information
+            print("\n" + "="*60)
+            print(f"📊 Available Products: {len(self.products)}")
+            print("="*60)
 
-        input("\nPress Enter to continue...")
+            if self._products_table is None:
+                rows = []
+                for p in self.products:
+                    price_str = f"${p['price']:>10,.2f}" if p['price'] else "N/A".rjust(10)
+
+                    # Format leverage information
+                    leverage_str = f"{p['max_leverage']:>4.0f}x" if p.get('max_leverage') else " N/A"
+
+                    default_marker = " ⭐" if p['product_id'] == DEFAULT_PRODUCT_ID else ""
+                    rows.append(f"  ID: {p['product_id']:2d} | {p['symbol']:10s} | Price: {price_str} | Max Leverage: {leverage_str}{default_marker}")
+                self._products_table = "\n".join(rows)
+            print(self._products_table)
+
+            if DEFAULT_PRODUCT_ID in self.product_map:
+                print(f"\n⭐ Default trading product: {self.symbol_by_pid[DEFAULT_PRODUCT_ID]} (ID: {DEFAULT_PRODUCT_ID})")
+
+        await self.ainput("\nPress Enter to continue...")
+
+    def _offset_price(self, product_id: int, price: float, offset: float) -> float:
+        """Shift a price by an offset, counting in whole ticks when the tick size is known."""
+        tick = self.product_map[product_id].get('tick_size')
+        if not tick:
+            return price + offset
+        # Integer ticks, so the suggestion is always a price the engine accepts
+        ticks = round(price / tick) + round(offset / tick)
+        return round(ticks * tick, 12)
+
+    def _snap_to_tick(self, product_id: int, price: float) -> float:
+        """Round a price to the nearest tick, when the tick size is known."""
+        tick = self.product_map[product_id].get('tick_size')
+        if not tick:
+            return price
+        return round(round(price / tick) * tick, 12)
+
+    def _snap_to_lot(self, product_id: int, size: float) -> float:
+        """Round a size to the nearest lot, when the lot size is known."""
+        lot = self.product_map[product_id].get('lot_size')
+        if not lot:
+            return size
+        return round(round(size / lot) * lot, 12)
+
+    def _validate_order(self, product_id: int, size: float, price: float) -> Optional[str]:
+        """
+        Check a snapped order against the product's limits before sending it.
+
+        Returns:
+            Error message for the user, or None if the engine should accept it
+        """
+        if price <= 0:
+            return f"Price must be positive (tick size: {self.product_map[product_id].get('tick_size')})"
+        if size <= 0:
+            return f"Size rounds to zero (lot size: {self.product_map[product_id].get('lot_size')})"
+        min_size = self.product_map[product_id].get('min_size')
+        if min_size and size * price < min_size:
+            return f"Order value ${size * price:,.2f} is below the ${min_size:,.2f} minimum for {self.symbol_by_pid[product_id]}"
+        return None
+
+    async def quick_buy(self, product_id: int, size: float, price: float) -> Dict[str, Any]:
+        """
+        Place a buy limit order without any prompts.
+
+        Uses the POST_ONLY, REDUCE_ONLY and TIME_IN_FORCE settings from
+        config.py, like option 2.
+
+        Args:
+            product_id: Product ID
+            size: Order size
+            price: Limit price
+
+        Returns:
+            Order result from NadoTrader.buy_limit()
+        """
+        return await self._submit_order(self.trader.buy_limit, product_id, size, price)
+
+    async def quick_sell(self, product_id: int, size: float, price: float) -> Dict[str, Any]:
+        """
+        Place a sell limit order without any prompts.
+
+        Uses the POST_ONLY, REDUCE_ONLY and TIME_IN_FORCE settings from
+        config.py, like option 3.
+
+        Args:
+            product_id: Product ID
+            size: Order size
+            price: Limit price
+
+        Returns:
+            Order result from NadoTrader.sell_limit()
+        """
+        return await self._submit_order(self.trader.sell_limit, product_id, size, price)
+
+    async def _submit_order(self, place, product_id: int, size: float, price: float) -> Dict[str, Any]:
+        """Send one order with the configured flags and drop stale order/position snapshots."""
+        try:
+            return await place(
+                product_id=product_id,
+                price=price,
+                size=size,
+                post_only=POST_ONLY,
+                reduce_only=REDUCE_ONLY,
+                time_in_force=TIME_IN_FORCE
+            )
+        finally:
+            # Orders and positions just changed; don't serve a pre-trade snapshot
+            self._open_orders.invalidate()
+            self._positions.invalidate()
 
     async def place_buy_order(self):
         """Place a buy limit order."""
@@ -182,22 +404,22 @@ class TradingMenu:
         print("="*60)
 
         # Get product ID
-        product_id_input = input(f"Product ID (default: {DEFAULT_PRODUCT_ID}): ").strip()
+        product_id_input = (await self.ainput(f"Product ID (default: {DEFAULT_PRODUCT_ID}): ")).strip()
         product_id = int(product_id_input) if product_id_input else DEFAULT_PRODUCT_ID
 
         if product_id not in self.product_map:
             print(f"❌ Invalid product ID: {product_id}")
             return
 
-        product_symbol = self.product_map[product_id]['symbol']
+        product_symbol = self.symbol_by_pid[product_id]
         current_price = self.product_map[product_id].get('price')
 
         # Show current price and orderbook
         try:
-            orderbook = await self.trader.get_orderbook(product_id, depth=5)
-            if orderbook['bids'] and orderbook['asks']:
-                best_bid = orderbook['bids'][0]['price']
-                best_ask = orderbook['asks'][0]['price']
+            quote = await self._best_bid_offer(product_id)
+            if quote['bid'] and quote['ask']:
+                best_bid = quote['bid']
+                best_ask = quote['ask']
                 print(f"\n📊 {product_symbol} Market:")
                 print(f"   Best Bid: ${best_bid:,.2f}")
                 print(f"   Best Ask: ${best_ask:,.2f}")
@@ -206,17 +428,17 @@ class TradingMenu:
             print(f"⚠️  Could not fetch orderbook: {e}")
 
         # Get order size
-        size_input = input(f"Order size (default: {DEFAULT_ORDER_SIZE}): ").strip()
+        size_input = (await self.ainput(f"Order size (default: {DEFAULT_ORDER_SIZE}): ")).strip()
         size = float(size_input) if size_input else DEFAULT_ORDER_SIZE
 
         # Get order price
         if current_price:
-            suggested_price = current_price - PRICE_OFFSET_USD
+            suggested_price = self._offset_price(product_id, current_price, -PRICE_OFFSET_USD)
             print(f"\nSuggested price: ${suggested_price:,.2f} (market ${current_price:,.2f} - offset ${PRICE_OFFSET_USD})")
         else:
             suggested_price = None
 
-        price_input = input(f"Order price (USD){f' (default: {suggested_price:.2f})' if suggested_price else ''}: ").strip()
+        price_input = (await self.ainput(f"Order price (USD){f' (default: {suggested_price:.2f})' if suggested_price else ''}: ")).strip()
 
         if not price_input and suggested_price:
             price = suggested_price
@@ -226,6 +448,14 @@ class TradingMenu:
             print("❌ Price is required")
             return
 
+        # The engine only takes whole ticks/lots; catch what it would reject
+        price = self._snap_to_tick(product_id, price)
+        size = self._snap_to_lot(product_id, size)
+        error = self._validate_order(product_id, size, price)
+        if error:
+            print(f"❌ {error}")
+            return
+
         # Confirm order
         order_value = size * price
         print(f"\n📋 Order Summary:")
@@ -236,18 +466,11 @@ class TradingMenu:
         print(f"   Value:      ${order_value:,.2f}")
         print(f"   Post Only:  {POST_ONLY}")
 
-        confirm = input("\n✅ Place this order? (y/n): ").strip().lower()
+        confirm = (await self.ainput("\n✅ Place this order? (y/n): ")).strip().lower()
 
         if confirm == 'y':
             try:
-                result = await self.trader.buy_limit(
-                    product_id=product_id,
-                    price=price,
-                    size=size,
-                    post_only=POST_ONLY,
-                    reduce_only=REDUCE_ONLY,
-                    time_in_force=TIME_IN_FORCE
-                )
+                result = await self.quick_buy(product_id, size, price)
 
                 if result.get('success'):
                     print(f"\n✅ Order placed successfully!")
@@ -259,7 +482,7 @@ class TradingMenu:
         else:
             print("\n❌ Order cancelled")
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
 
     async def place_sell_order(self):
         """Place a sell limit order (close position)."""
@@ -268,34 +491,37 @@ class TradingMenu:
         print("="*60)
 
         # Show current positions
-        positions = await self.trader.get_positions()
+        positions = await self._positions()
         if positions:
             print("\n💼 Current Positions:")
+            symbols = self.symbol_by_pid
+            rows = []
             for pos in positions:
-                product_symbol = self.product_map.get(pos['product_id'], {}).get('symbol', f"Product {pos['product_id']}")
+                product_symbol = symbols.get(pos['product_id']) or f"Product {pos['product_id']}"
                 size = abs(pos['size'])
                 pnl = pos['unrealized_pnl']
-                print(f"   {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | PnL: ${pnl:>10.2f}")
+                rows.append(f"   {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | PnL: ${pnl:>10.2f}")
+            print("\n".join(rows))
         else:
             print("\n⚠️  No open positions")
 
         # Get product ID
-        product_id_input = input(f"\nProduct ID (default: {DEFAULT_PRODUCT_ID}): ").strip()
+        product_id_input = (await self.ainput(f"\nProduct ID (default: {DEFAULT_PRODUCT_ID}): ")).strip()
         product_id = int(product_id_input) if product_id_input else DEFAULT_PRODUCT_ID
 
         if product_id not in self.product_map:
             print(f"❌ Invalid product ID: {product_id}")
             return
 
-        product_symbol = self.product_map[product_id]['symbol']
+        product_symbol = self.symbol_by_pid[product_id]
         current_price = self.product_map[product_id].get('price')
 
         # Show current price and orderbook
         try:
-            orderbook = await self.trader.get_orderbook(product_id, depth=5)
-            if orderbook['bids'] and orderbook['asks']:
-                best_bid = orderbook['bids'][0]['price']
-                best_ask = orderbook['asks'][0]['price']
+            quote = await self._best_bid_offer(product_id)
+            if quote['bid'] and quote['ask']:
+                best_bid = quote['bid']
+                best_ask = quote['ask']
                 print(f"\n📊 {product_symbol} Market:")
                 print(f"   Best Bid: ${best_bid:,.2f}")
                 print(f"   Best Ask: ${best_ask:,.2f}")
@@ -304,17 +530,17 @@ class TradingMenu:
             print(f"⚠️  Could not fetch orderbook: {e}")
 
         # Get order size
-        size_input = input(f"Order size (default: {DEFAULT_ORDER_SIZE}): ").strip()
+        size_input = (await self.ainput(f"Order size (default: {DEFAULT_ORDER_SIZE}): ")).strip()
         size = float(size_input) if size_input else DEFAULT_ORDER_SIZE
 
         # Get order price
         if current_price:
-            suggested_price = current_price + PRICE_OFFSET_USD
+            suggested_price = self._offset_price(product_id, current_price, +PRICE_OFFSET_USD)
             print(f"\nSuggested price: ${suggested_price:,.2f} (market ${current_price:,.2f} + offset ${PRICE_OFFSET_USD})")
         else:
             suggested_price = None
 
-        price_input = input(f"Order price (USD){f' (default: {suggested_price:.2f})' if suggested_price else ''}: ").strip()
+        price_input = (await self.ainput(f"Order price (USD){f' (default: {suggested_price:.2f})' if suggested_price else ''}: ")).strip()
 
         if not price_input and suggested_price:
             price = suggested_price
@@ -324,6 +550,14 @@ class TradingMenu:
             print("❌ Price is required")
             return
 
+        # The engine only takes whole ticks/lots; catch what it would reject
+        price = self._snap_to_tick(product_id, price)
+        size = self._snap_to_lot(product_id, size)
+        error = self._validate_order(product_id, size, price)
+        if error:
+            print(f"❌ {error}")
+            return
+
         # Confirm order
         order_value = size * price
         print(f"\n📋 Order Summary:")
@@ -334,18 +568,11 @@ class TradingMenu:
         print(f"   Value:      ${order_value:,.2f}")
         print(f"   Post Only:  {POST_ONLY}")
 
-        confirm = input("\n✅ Place this order? (y/n): ").strip().lower()
+        confirm = (await self.ainput("\n✅ Place this order? (y/n): ")).strip().lower()
 
         if confirm == 'y':
             try:
-                result = await self.trader.sell_limit(
-                    product_id=product_id,
-                    price=price,
-                    size=size,
-                    post_only=POST_ONLY,
-                    reduce_only=REDUCE_ONLY,
-                    time_in_force=TIME_IN_FORCE
-                )
+                result = await self.quick_sell(product_id, size, price)
 
                 if result.get('success'):
                     print(f"\n✅ Order placed successfully!")
@@ -357,7 +584,90 @@ class TradingMenu:
         else:
             print("\n❌ Order cancelled")
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
+
+    async def place_multi_order(self):
+        """Place several limit orders with a single batch request."""
+        print("\n" + "="*60)
+        print("📚 PLACE MULTIPLE LIMIT ORDERS")
+        print("="*60)
+        print("Enter one order per prompt; leave the product ID empty to finish.")
+
+        orders = []
+        while True:
+            product_id_input = (await self.ainput(f"\nOrder #{len(orders) + 1} product ID: ")).strip()
+            if not product_id_input:
+                break
+
+            product_id = int(product_id_input)
+            if product_id not in self.product_map:
+                print(f"❌ Invalid product ID: {product_id}")
+                continue
+
+            side = (await self.ainput("Side (buy/sell): ")).strip().lower()
+            if side not in ('buy', 'sell'):
+                print(f"❌ Invalid side: {side}")
+                continue
+
+            size_input = (await self.ainput(f"Order size (default: {DEFAULT_ORDER_SIZE}): ")).strip()
+            size = float(size_input) if size_input else DEFAULT_ORDER_SIZE
+
+            price_input = (await self.ainput("Order price (USD): ")).strip()
+            if not price_input:
+                print("❌ Price is required")
+                continue
+
+            price = self._snap_to_tick(product_id, float(price_input))
+            size = self._snap_to_lot(product_id, size)
+            error = self._validate_order(product_id, size, price)
+            if error:
+                print(f"❌ {error}")
+                continue
+
+            orders.append({
+                'product_id': product_id,
+                'side': side,
+                'size': size,
+                'price': price,
+                'post_only': POST_ONLY,
+                'reduce_only': REDUCE_ONLY,
+                'time_in_force': TIME_IN_FORCE
+            })
+
+        if not orders:
+            print("\n⚠️  No orders entered")
+            await self.ainput("\nPress Enter to continue...")
+            return
+
+        # Confirm orders
+        print(f"\n📋 Orders Summary: {len(orders)}")
+        for o in orders:
+            print(f"   {self.symbol_by_pid[o['product_id']]:10s} | {o['side'].upper():4s} | Size: {o['size']:>8.4f} | Price: ${o['price']:>10,.2f}")
+        print(f"   Post Only:  {POST_ONLY}")
+
+        confirm = (await self.ainput(f"\n✅ Place these {len(orders)} orders? (y/n): ")).strip().lower()
+
+        if confirm == 'y':
+            try:
+                # One signed request per 50 orders instead of one per order
+                results = await self.trader.place_batch_orders(orders)
+
+                for o, result in zip(orders, results):
+                    product_symbol = self.symbol_by_pid[o['product_id']]
+                    if result.get('success'):
+                        print(f"   ✅ {product_symbol:10s} {o['side'].upper():4s} | Order ID: {result.get('order_id', 'N/A')[:16]}...")
+                    else:
+                        print(f"   ❌ {product_symbol:10s} {o['side'].upper():4s} | {result.get('error', 'Unknown error')}")
+            except Exception as e:
+                print(f"\n❌ Error placing orders: {e}")
+
+            # Orders and positions just changed; don't serve a pre-trade snapshot
+            self._open_orders.invalidate()
+            self._positions.invalidate()
+        else:
+            print("\n❌ Orders cancelled")
+
+        await self.ainput("\nPress Enter to continue...")
 
     async def cancel_all_orders(self):
         """Cancel all open orders."""
@@ -366,22 +676,24 @@ class TradingMenu:
         print("="*60)
 
         # Show current open orders
-        open_orders = await self.trader.get_open_orders()
+        open_orders = await self._open_orders()
 
         if not open_orders:
             print("\n⚠️  No open orders to cancel")
-            input("\nPress Enter to continue...")
+            await self.ainput("\nPress Enter to continue...")
             return
 
         print(f"\n📋 Current Open Orders: {len(open_orders)}")
+        symbols = self.symbol_by_pid
+        rows = []
         for order in open_orders:
-            size = abs(float(order['amount']))
-            unfilled = float(order.get('unfilled_amount', size))
-            price = float(order['price'])
-            product_symbol = self.product_map.get(order['product_id'], {}).get('symbol', f"Product {order['product_id']}")
-            print(f"   {product_symbol:10s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Price: ${price:>8.2f}")
+            size = abs(order['amount'])
+            price = order['price']
+            product_symbol = symbols.get(order['product_id']) or f"Product {order['product_id']}"
+            rows.append(f"   {product_symbol:10s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Price: ${price:>8.2f}")
+        print("\n".join(rows))
 
-        confirm = input(f"\n⚠️  Cancel ALL {len(open_orders)} orders? (y/n): ").strip().lower()
+        confirm = (await self.ainput(f"\n⚠️  Cancel ALL {len(open_orders)} orders? (y/n): ")).strip().lower()
 
         if confirm == 'y':
             try:
@@ -393,10 +705,14 @@ class TradingMenu:
                     print(f"\n❌ Cancellation failed: {result.get('error', 'Unknown error')}")
             except Exception as e:
                 print(f"\n❌ Error cancelling orders: {e}")
+
+            # Orders and positions just changed; don't serve a pre-trade snapshot
+            self._open_orders.invalidate()
+            self._positions.invalidate()
         else:
             print("\n❌ Cancellation aborted")
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
 
     async def view_open_orders(self):
         """View all open orders."""
@@ -404,21 +720,25 @@ class TradingMenu:
         print("📋 OPEN ORDERS")
         print("="*60)
 
-        open_orders = await self.trader.get_open_orders()
+        open_orders = await self._open_orders()
 
-        if not open_orders:
-            print("\n⚠️  No open orders")
-        else:
-            print(f"\nTotal: {len(open_orders)} orders\n")
-            for order in open_orders:
-                size = abs(float(order['amount']))
-                unfilled = float(order.get('unfilled_amount', size))
-                price = float(order['price'])
-                order_value = unfilled * price
-                product_symbol = self.product_map.get(order['product_id'], {}).get('symbol', f"Product {order['product_id']}")
-                print(f"   {product_symbol:10s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Unfilled: {unfilled:>8.4f} | Price: ${price:>8.2f} | Value: ${order_value:>10.2f}")
+        with _batched_output():
+            if not open_orders:
+                print("\n⚠️  No open orders")
+            else:
+                print(f"\nTotal: {len(open_orders)} orders\n")
+                symbols = self.symbol_by_pid
+                rows = []
+                for order in open_orders:
+                    size = abs(order['amount'])
+                    unfilled = order.get('unfilled_amount', size)
+                    price = order['price']
+                    order_value = unfilled * price
+                    product_symbol = symbols.get(order['product_id']) or f"Product {order['product_id']}"
+                    rows.append(f"   {product_symbol:10s} | {order['side'].upper():4s} | Size: {size:>8.4f} | Unfilled: {unfilled:>8.4f} | Price: ${price:>8.2f} | Value: ${order_value:>10.2f}")
+                print("\n".join(rows))
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
 
     async def view_positions(self):
         """View all open positions."""
@@ -426,24 +746,28 @@ class TradingMenu:
         print("💼 OPEN POSITIONS")
         print("="*60)
 
-        positions = await self.trader.get_positions()
+        positions = await self._positions()
 
-        if not positions:
-            print("\n⚠️  No open positions")
-        else:
-            print(f"\nTotal: {len(positions)} positions\n")
-            total_pnl = 0
-            for pos in positions:
-                product_symbol = self.product_map.get(pos['product_id'], {}).get('symbol', f"Product {pos['product_id']}")
-                size = abs(pos['size'])
-                pnl = pos['unrealized_pnl']
-                total_pnl += pnl
-                pnl_str = f"${pnl:>10.2f}"
-                print(f"   {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | Unrealized PnL: {pnl_str}")
+        with _batched_output():
+            if not positions:
+                print("\n⚠️  No open positions")
+            else:
+                print(f"\nTotal: {len(positions)} positions\n")
+                total_pnl = 0
+                symbols = self.symbol_by_pid
+                rows = []
+                for pos in positions:
+                    product_symbol = symbols.get(pos['product_id']) or f"Product {pos['product_id']}"
+                    size = abs(pos['size'])
+                    pnl = pos['unrealized_pnl']
+                    total_pnl += pnl
+                    pnl_str = f"${pnl:>10.2f}"
+                    rows.append(f"   {product_symbol:10s} | {pos['side'].upper():5s} | Size: {size:>10.4f} | Unrealized PnL: {pnl_str}")
+                print("\n".join(rows))
 
-            print(f"\n   Total Unrealized PnL: ${total_pnl:>10.2f}")
+                print(f"\n   Total Unrealized PnL: ${total_pnl:>10.2f}")
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
 
     async def show_funding_rate(self):
         """Display the current funding rate for a specified product."""
@@ -452,15 +776,15 @@ class TradingMenu:
         print("="*60)
 
         # Get product ID
-        product_id_input = input(f"Product ID (default: {DEFAULT_PRODUCT_ID}): ").strip()
+        product_id_input = (await self.ainput(f"Product ID (default: {DEFAULT_PRODUCT_ID}): ")).strip()
         product_id = int(product_id_input) if product_id_input else DEFAULT_PRODUCT_ID
 
         if product_id not in self.product_map:
             print(f"❌ Invalid product ID: {product_id}")
-            input("\nPress Enter to continue...")
+            await self.ainput("\nPress Enter to continue...")
             return
 
-        product_symbol = self.product_map[product_id]['symbol']
+        product_symbol = self.symbol_by_pid[product_id]
 
         try:
             data = await self.trader.get_funding_rate(product_id)
@@ -485,7 +809,7 @@ class TradingMenu:
         except Exception as e:
             print(f"\n❌ Error fetching funding rate: {e}")
 
-        input("\nPress Enter to continue...")
+        await self.ainput("\nPress Enter to continue...")
 
     async def run(self):
         """Run the interactive menu."""
@@ -494,7 +818,7 @@ class TradingMenu:
 
             while True:
                 self.display_menu()
-                choice = input("\nEnter your choice: ").strip()
+                choice = (await self.ainput("\nEnter your choice: ")).strip()
 
                 if choice == '1':
                     await self.show_products_info()
@@ -510,14 +834,17 @@ class TradingMenu:
                     await self.view_positions()
                 elif choice == '7':
                     await self.show_funding_rate()
+                elif choice == '8':
+                    await self.place_multi_order()
                 elif choice == '0':
                     print("\n👋 Goodbye!")
                     break
                 else:
                     print("\n❌ Invalid choice. Please try again.")
-                    input("\nPress Enter to continue...")
+                    await self.ainput("\nPress Enter to continue...")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C cancels the main task while it awaits a prompt
             print("\n\n⚠️  Interrupted by user")
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -534,4 +861,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Show the trader's status messages as plain lines
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        run(main())  # uvloop when installed
+    except KeyboardInterrupt:
+        pass  # Already reported by the menu